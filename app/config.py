@@ -32,6 +32,75 @@ class Config:
 
     # llm settings
     GEMINI = os.getenv("GEMINI")
+    LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30"))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    LLM_RETRY_BACKOFF = float(os.getenv("LLM_RETRY_BACKOFF", "0.5"))
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+    LLM_MAX_QUEUE = int(os.getenv("LLM_MAX_QUEUE", "128"))
+    # LLM backend: "gemini", "stub" (offline, simulated latency) or "record"/"replay"
+    LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+    LLM_RECORD_DIR = os.getenv("LLM_RECORD_DIR", "llm_recordings")
+    LLM_STUB_LATENCY_MS = float(os.getenv("LLM_STUB_LATENCY_MS", "800"))
+    LLM_STUB_JITTER_MS = float(os.getenv("LLM_STUB_JITTER_MS", "300"))
+    LLM_STUB_LATENCY_DIST = os.getenv("LLM_STUB_LATENCY_DIST", "lognormal")
+    LLM_STUB_ERROR_RATE = float(os.getenv("LLM_STUB_ERROR_RATE", "0"))
+    LLM_STUB_SEED = int(os.getenv("LLM_STUB_SEED", "0"))
+    # Persistent LLM response cache (sqlite)
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm_responses.sqlite3")
+    LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+    LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "64"))
+    # "background": score each answer when recorded; "batch": one call at the end
+    SCORING_MODE = os.getenv("SCORING_MODE", "background")
+    # Adaptive follow-ups asked after the core questions (web flow), generated
+    # speculatively as soon as the last core answer is transcribed
+    MAX_FOLLOW_UPS = int(os.getenv("MAX_FOLLOW_UPS", "1"))
+    FOLLOW_UP_PREFETCH = os.getenv("FOLLOW_UP_PREFETCH", "true").lower() == "true"
+
+    # Question bank: pre-generated question pools per role
+    QUESTION_POOL_SIZE = int(os.getenv("QUESTION_POOL_SIZE", "15"))
+    QUESTION_POOL_TTL = float(os.getenv("QUESTION_POOL_TTL", "21600"))
+    QUESTION_BANK_ROLES = [role.strip() for role in os.getenv("QUESTION_BANK_ROLES", "Software Engineer").split(",") if role.strip()]
+    QUESTION_BANK_POPULAR_ROLES = int(os.getenv("QUESTION_BANK_POPULAR_ROLES", "10"))
+    QUESTION_BANK_REFRESH_INTERVAL = float(os.getenv("QUESTION_BANK_REFRESH_INTERVAL", "300"))
+
+    # Session registry settings
+    SESSION_IDLE_TTL = float(os.getenv("SESSION_IDLE_TTL", "1800"))
+    SESSION_MAX_ACTIVE = int(os.getenv("SESSION_MAX_ACTIVE", "500"))
+    SESSION_MAX_MEMORY_MB = int(os.getenv("SESSION_MAX_MEMORY_MB", "512"))
+    SESSION_SWEEP_INTERVAL = float(os.getenv("SESSION_SWEEP_INTERVAL", "60"))
+
+    # Speech-to-text settings
+    STT_RECOGNIZER_POOL_SIZE = int(os.getenv("STT_RECOGNIZER_POOL_SIZE", "32"))
+    STT_END_SILENCE = float(os.getenv("STT_END_SILENCE", "1.2"))
+    VAD_THRESHOLD_RATIO = float(os.getenv("VAD_THRESHOLD_RATIO", "3.0"))
+    VAD_MIN_RMS = float(os.getenv("VAD_MIN_RMS", "200"))
+    VAD_HANGOVER_MS = int(os.getenv("VAD_HANGOVER_MS", "300"))
+
+    # Answer audio archival (FLAC per answer, indexed by session and question)
+    ARCHIVE_ENABLED = os.getenv("ARCHIVE_ENABLED", "true").lower() == "true"
+    ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "recordings")
+    ARCHIVE_MAX_SECONDS = float(os.getenv("ARCHIVE_MAX_SECONDS", "180"))
+
+    # Text-to-speech settings ("gtts" or "offline")
+    TTS_ENGINE = os.getenv("TTS_ENGINE", "gtts")
+    TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", ".cache/tts")
+    TTS_CACHE_MAX_MB = int(os.getenv("TTS_CACHE_MAX_MB", "256"))
+
+    # Executor pools for blocking work
+    INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", str(max((os.cpu_count() or 2) // 2, 1))))
+    INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "16"))
+
+    # Emotion inference settings
+    EMOTION_BATCHING = os.getenv("EMOTION_BATCHING", "true").lower() == "true"
+    EMOTION_BATCH_WINDOW_MS = float(os.getenv("EMOTION_BATCH_WINDOW_MS", "15"))
+    EMOTION_BATCH_MAX = int(os.getenv("EMOTION_BATCH_MAX", "32"))
+    FACE_DETECTOR_BACKEND = os.getenv("FACE_DETECTOR_BACKEND", "opencv")
+    DEMOGRAPHICS_REFRESH_SECONDS = float(os.getenv("DEMOGRAPHICS_REFRESH_SECONDS", "30"))
+    FACE_DETECT_EVERY = int(os.getenv("FACE_DETECT_EVERY", "10"))
+    FACE_TRACK_MIN_SCORE = float(os.getenv("FACE_TRACK_MIN_SCORE", "0.6"))
+    FRAME_DEDUP_THRESHOLD = float(os.getenv("FRAME_DEDUP_THRESHOLD", "3.0"))
+    FRAME_DEDUP_MAX_REUSE = int(os.getenv("FRAME_DEDUP_MAX_REUSE", "15"))
 
 # Make GEMINI available as module-level variable for imports
 GEMINI = Config.GEMINI
@@ -1,19 +1,26 @@
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from app.src.deepface import deepface_analyzer
-from app.src.utils import InterviewController
-from typing import Dict, Optional, List
-import json
+from app.src.utils import (
+    InterviewController, record_scoring_usage, scoring_stats, question_gap, follow_up_stats
+)
+from app.src.sessions import SessionBusyError, SessionRegistry, is_valid_session_id
+from app.src.stt import recognizer_pool, endpoint_latency, StreamingTranscriber
+from app.src.vad import vad_totals
+from app.src.executors import PoolSaturatedError, inference_executor
+from app.src.streaming import LatestFrameSlot
+from app.src.warmup import readiness
+from app.src.llm import get_backend, llm_client
+from app.src.question_bank import question_bank
+from app.src.tts import tts_cache
+from app.src.archive import answer_archiver, answer_buffers
+from app.config import Config
+from typing import Optional, List
 import asyncio
-import base64
-import cv2
-import numpy as np
-from PIL import Image
-from io import BytesIO
 
 app = FastAPI(title="Aivox.io")
 
@@ -33,6 +40,7 @@ app.add_middleware(
 class ImageAnalysisRequest(BaseModel):
     image: str  # base64 encoded image
     session_id: str = "default"
+    actions: Optional[List[str]] = None  # subset of emotion/age/gender/race
 
 class FeedbackRequest(BaseModel):
     emotion: str
@@ -40,18 +48,67 @@ class FeedbackRequest(BaseModel):
 
 class StartInterviewRequest(BaseModel):
     user_role: str
+    session_id: Optional[str] = None
 
 class RecordAnswerRequest(BaseModel):
     session_id: str = "default"
+    source: str = "microphone"  # "microphone" (server sound card) or "client" (/ws/stt)
 
 class EmotionAnalysisRequest(BaseModel):
     image: str  # base64 encoded image
+    session_id: str = "default"
 
 class FinishInterviewRequest(BaseModel):
     session_id: str = "default"
 
-# Global interview controller
-interview_controller = None
+# Interview controllers keyed by session_id
+session_registry = SessionRegistry(
+    idle_ttl=Config.SESSION_IDLE_TTL,
+    max_sessions=Config.SESSION_MAX_ACTIVE,
+    max_memory_bytes=Config.SESSION_MAX_MEMORY_MB * 1024 * 1024,
+    on_evict=lambda controller: controller.cleanup()
+)
+
+@app.exception_handler(PoolSaturatedError)
+async def pool_saturated_handler(request: Request, exc: PoolSaturatedError):
+    """Shed load with 503 + Retry-After instead of queueing without bound"""
+    return JSONResponse(
+        status_code=503,
+        content={'success': False, 'detail': str(exc)},
+        headers={'Retry-After': str(exc.retry_after)}
+    )
+
+def get_controller(session_id: str) -> InterviewController:
+    """Look up the interview controller for a session or fail with 400"""
+    controller = session_registry.get(session_id)
+    if controller is None:
+        raise HTTPException(status_code=400, detail="Interview not initialized")
+    return controller
+
+@app.on_event("startup")
+async def start_session_sweeper():
+    asyncio.create_task(session_registry.run_sweeper(Config.SESSION_SWEEP_INTERVAL))
+
+# Models loaded (and exercised once) before the worker reports ready
+readiness.register("vosk", recognizer_pool.warm_up)
+readiness.register("deepface", deepface_analyzer.warm_up)
+readiness.register("llm_client", get_backend)
+
+@app.on_event("startup")
+async def warm_up_models():
+    """Warm models in the background; /health/ready turns green when done"""
+    asyncio.create_task(readiness.warm_up())
+
+@app.on_event("startup")
+async def warm_question_bank():
+    """Pre-generate question pools for configured roles and keep popular ones warm"""
+    question_bank.pin(Config.QUESTION_BANK_ROLES)
+    asyncio.create_task(question_bank.run_refresher(Config.QUESTION_BANK_REFRESH_INTERVAL))
+
+@app.on_event("shutdown")
+async def flush_answer_archive():
+    """Give queued answer recordings a chance to reach disk"""
+    await asyncio.to_thread(answer_archiver.flush, 10)
 
 # Serve static assets from landing directory
 app.mount("/assets", StaticFiles(directory="landing/assets"), name="assets")
@@ -63,6 +120,9 @@ async def index():
 @app.get("/interview")
 async def interview_page(request: Request):
     user_role = request.query_params.get('domain', 'Software Engineer')
+    # The interview usually starts moments later; refresh a known role's
+    # questions (a page view alone never generates a pool for a new role)
+    question_bank.warm(user_role)
     context = {
         "request": request,
         "title": "AI Interview Coach - Interview Session",
@@ -82,133 +142,460 @@ async def report_page(request: Request):
 @app.post("/start_interview")
 async def start_interview(request: StartInterviewRequest):
     """Start a new interview session"""
-    global interview_controller
+    session_id = request.session_id or session_registry.new_session_id()
+    if not is_valid_session_id(session_id):
+        raise HTTPException(status_code=400, detail="session_id may only contain letters, digits, '-' and '_'")
     
     try:
         # Initialize interview controller
-        interview_controller = InterviewController(request.user_role)
+        interview_controller = InterviewController(request.user_role, session_id)
         
         # Generate initial questions
-        questions = interview_controller.session.initialize_questions()
+        questions = await interview_controller.session.ainitialize_questions()
+        try:
+            session_registry.put(session_id, interview_controller)
+        except SessionBusyError:
+            interview_controller.cleanup()
+            raise HTTPException(status_code=409, detail="Session is busy; retry once its current request finishes")
+        interview_controller.prefetch_question_audio()
         
         return JSONResponse(content={
             'success': True,
+            'session_id': session_id,
             'questions': questions,
             'message': f'Interview initialized for {request.user_role}'
         })
+    except (HTTPException, PoolSaturatedError):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start interview: {str(e)}")
 
 @app.get("/ask_question/{question_index}")
-async def ask_question(question_index: int):
-    """Ask a specific question using TTS"""
-    global interview_controller
+async def ask_question(question_index: int, session_id: str = "default", play: bool = True):
+    """
+    Ask a specific question using TTS.
+    
+    With play=false nothing is played on the server; the response carries an
+    audio_url for the browser to fetch from /question_audio instead.
+    """
+    interview_controller = session_registry.get(session_id)
     
     if not interview_controller or question_index >= len(interview_controller.session.questions):
         raise HTTPException(status_code=404, detail="Invalid question index")
     
     try:
         question = interview_controller.session.questions[question_index]
+        success = True
         
-        # Run TTS 
-        success = await interview_controller.audio_handler.text_to_speech(question)
+        if play:
+            async with session_registry.session(session_id):
+                # Run TTS 
+                success = await interview_controller.audio_handler.text_to_speech(question)
         
         return JSONResponse(content={
             'success': success,
             'question': question,
-            'question_index': question_index
+            'question_index': question_index,
+            'audio_url': f"/question_audio/{question_index}?session_id={session_id}"
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to ask question: {str(e)}")
 
+def parse_byte_range(range_header: str, size: int) -> Optional[tuple]:
+    """Parse a single 'bytes=start-end' range; None if absent or unsatisfiable"""
+    if not range_header or not range_header.startswith('bytes=') or ',' in range_header:
+        return None
+    start_text, _, end_text = range_header[6:].strip().partition('-')
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(end_text), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        return None
+    return start, min(end, size - 1)
+
+@app.get("/question_audio/{question_index}")
+async def question_audio(question_index: int, request: Request, session_id: str = "default"):
+    """
+    Synthesized audio for a question, for playback in the browser.
+    
+    Served from the TTS cache with Content-Length, ETag and single byte-range
+    support, so the request completes as soon as the bytes are sent.
+    """
+    interview_controller = get_controller(session_id)
+    questions = interview_controller.session.questions
+    if question_index >= len(questions):
+        raise HTTPException(status_code=404, detail="Invalid question index")
+    
+    question = questions[question_index]
+    etag = f'"{tts_cache.key(question)}"'
+    headers = {
+        'ETag': etag,
+        'Accept-Ranges': 'bytes',
+        'Cache-Control': 'private, max-age=86400'
+    }
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
+    
+    try:
+        audio_path = tts_cache.get(question) or await asyncio.to_thread(tts_cache.get_or_synthesize, question)
+        with open(audio_path, 'rb') as audio_file:
+            audio = audio_file.read()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to synthesize question: {str(e)}")
+    
+    size = len(audio)
+    range_header = request.headers.get('range')
+    if range_header:
+        byte_range = parse_byte_range(range_header, size)
+        if byte_range is None:
+            return Response(status_code=416, headers={**headers, 'Content-Range': f'bytes */{size}'})
+        start, end = byte_range
+        return Response(
+            content=audio[start:end + 1],
+            status_code=206,
+            media_type=tts_cache.media_type,
+            headers={**headers, 'Content-Range': f'bytes {start}-{end}/{size}'}
+        )
+    
+    return Response(content=audio, media_type=tts_cache.media_type, headers=headers)
+
 @app.post("/record_answer")
 async def record_answer(request: RecordAnswerRequest):
     """Record user answer using STT"""
-    global interview_controller
-    
-    if not interview_controller:
-        raise HTTPException(status_code=400, detail="Interview not initialized")
+    interview_controller = get_controller(request.session_id)
     
     try:
-        # Record answer using STT
-        answer = await interview_controller.audio_handler.speech_to_text()
-        
-        # Score the answer
-        current_question_index = len(interview_controller.session.answers)
-        if current_question_index < len(interview_controller.session.questions):
-            current_question = interview_controller.session.questions[current_question_index]
+        async with session_registry.session(request.session_id):
+            # Record answer using STT
+            if request.source == "client":
+                answer = await interview_controller.audio_handler.wait_client_transcript()
+            else:
+                answer = await interview_controller.audio_handler.speech_to_text()
             
-            score_result = interview_controller.report_generator.scorer.score_answer(
-                current_question, answer, interview_controller.session.user_role
-            )
+            current_question_index = len(interview_controller.session.answers)
+            if current_question_index >= len(interview_controller.session.questions):
+                raise HTTPException(status_code=400, detail="No more questions available")
+            
+            current_question = interview_controller.session.questions[current_question_index]
             
             interview_controller.session.answers.append(answer)
-            interview_controller.answer_scores.append(score_result)
+            if Config.FOLLOW_UP_PREFETCH and wants_follow_up(interview_controller):
+                # Generate the follow-up while the answer is scored
+                interview_controller.prefetch_follow_up()
             
-            return JSONResponse(content={
-                'success': True,
-                'answer': answer,
-                'score': score_result['score'],
-                'feedback': score_result['feedback']
-            })
-        else:
-            raise HTTPException(status_code=400, detail="No more questions available")
+            if Config.SCORING_MODE == "batch":
+                # Every answer is scored in one call by /finish_interview
+                interview_controller.answer_scores.append(None)
+                score_status = 'deferred'
+            else:
+                # Score in the background; the result is fetched from /score
+                interview_controller.scoring.submit(current_question, answer)
+                score_status = 'pending'
             
+        content = {
+            'success': True,
+            'answer': answer,
+            'question_index': current_question_index,
+            'score_status': score_status
+        }
+        if score_status == 'pending':
+            content['score_url'] = f"/score/{request.session_id}/{current_question_index}"
+        return JSONResponse(content=content)
+            
+    except HTTPException:
+        raise
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=408, detail="No transcript received from client audio stream")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to record answer: {str(e)}")
 
+def wants_follow_up(interview_controller: InterviewController) -> bool:
+    """True once the core questions are answered and a follow-up is still allowed"""
+    session = interview_controller.session
+    return (interview_controller.follow_ups_asked < Config.MAX_FOLLOW_UPS
+            and len(session.answers) == len(session.questions))
+
+@app.get("/follow_up_question")
+async def follow_up_question(session_id: str = "default"):
+    """
+    Adaptive follow-up to the answers so far, appended to the session's
+    questions. Usually already generated speculatively by /record_answer;
+    `question` is null when no follow-up is due or none could be generated.
+    """
+    interview_controller = get_controller(session_id)
+    if interview_controller.follow_up_task is None and wants_follow_up(interview_controller):
+        interview_controller.prefetch_follow_up()
+    
+    follow_up = await interview_controller.take_follow_up(timeout=Config.LLM_TIMEOUT)
+    if not follow_up:
+        return JSONResponse(content={'success': True, 'question': None})
+    
+    async with session_registry.session(session_id):
+        questions = interview_controller.session.questions
+        questions.append(follow_up)
+        interview_controller.follow_ups_asked += 1
+    
+    return JSONResponse(content={
+        'success': True,
+        'question': follow_up,
+        'question_index': len(questions) - 1,
+        'total_questions': len(questions)
+    })
+
+@app.get("/score/{session_id}/{question_index}")
+async def get_score(session_id: str, question_index: int, wait: float = 0):
+    """
+    Score of a recorded answer. With `wait` (seconds, max 60) the request
+    long-polls until the score is ready instead of returning "pending".
+    In batch mode answers are only scored by /finish_interview, so the
+    status stays "deferred" until then.
+    """
+    interview_controller = get_controller(session_id)
+    scoring = interview_controller.scoring
+    status = scoring.status(question_index)
+    if status is None:
+        raise HTTPException(status_code=404, detail="No answer recorded for this question")
+    if status == 'deferred':
+        return JSONResponse(content={'success': True, 'status': 'deferred', 'question_index': question_index})
+    
+    score_result = await scoring.wait(question_index, timeout=min(max(wait, 0), 60))
+    if score_result is None:
+        return JSONResponse(content={'success': True, 'status': 'pending', 'question_index': question_index})
+    
+    return JSONResponse(content={
+        'success': True,
+        'status': 'done',
+        'question_index': question_index,
+        'score': score_result['score'],
+        'feedback': score_result['feedback'],
+        'strengths': score_result.get('strengths', []),
+        'improvements': score_result.get('improvements', [])
+    })
+
 @app.post("/analyze_emotion")
 async def analyze_emotion(request: EmotionAnalysisRequest):
     """Analyze emotion from webcam frame"""
-    global interview_controller
-    
-    if not interview_controller:
-        raise HTTPException(status_code=400, detail="Interview not initialized")
+    # Frames only append to the emotion history, so they do not take the
+    # session lock and keep flowing while an answer is being recorded
+    interview_controller = get_controller(request.session_id)
     
     try:
-        # Remove data URL prefix if present
-        image_data = request.image
-        if image_data.startswith('data:image'):
-            image_data = image_data.split(',')[1]
+        frame = await inference_executor.run(deepface_analyzer.decode_base64_image, request.image)
+        result = await interview_controller.aadd_emotion_data(frame)
+        session_registry.resize(request.session_id)
         
-        # Decode base64 image
-        image_bytes = base64.b64decode(image_data)
-        image = Image.open(BytesIO(image_bytes))
-        frame = np.array(image)
+        return JSONResponse(content=result)
         
-        # Analyze emotion
-        result = interview_controller.add_emotion_data(frame)
+    except PoolSaturatedError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Emotion analysis failed: {str(e)}")
+
+@app.post("/analyze_emotion/frame")
+async def analyze_emotion_frame(request: Request, session_id: str = "default"):
+    """
+    Analyze emotion from a binary webcam frame.
+    
+    Accepts a raw `image/jpeg` (or png/webp) body, or multipart/form-data with
+    the frame in an `image` field, avoiding the base64-in-JSON overhead.
+    """
+    interview_controller = get_controller(session_id)
+    
+    content_type = request.headers.get('content-type', '')
+    if content_type.startswith('multipart/form-data'):
+        form = await request.form()
+        upload = form.get('image')
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Missing 'image' file field")
+        data = await upload.read()
+    else:
+        data = await request.body()
+    
+    if not data:
+        raise HTTPException(status_code=400, detail="Empty frame")
+    
+    try:
+        result = await interview_controller.aadd_encoded_frame(data)
+        session_registry.resize(session_id)
         
         return JSONResponse(content=result)
         
+    except PoolSaturatedError:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Emotion analysis failed: {str(e)}")
 
+@app.websocket("/ws/emotion/{session_id}")
+async def emotion_stream(websocket: WebSocket, session_id: str):
+    """
+    Stream webcam frames for emotion analysis over one connection.
+    
+    The client sends encoded frames as binary messages. Only the newest
+    unprocessed frame is kept; older ones are dropped so latency stays bounded
+    when analysis is slower than capture. Each result is pushed back with the
+    received/processed/dropped frame counters.
+    """
+    interview_controller = session_registry.get(session_id)
+    if interview_controller is None:
+        await websocket.close(code=4404)
+        return
+    
+    await websocket.accept()
+    slot = LatestFrameSlot()
+    
+    async def analyze_frames():
+        while True:
+            frame = await slot.get()
+            if frame is None:
+                return
+            if session_registry.get(session_id) is None:
+                await websocket.close(code=4410)
+                return
+            
+            try:
+                result = await interview_controller.aadd_encoded_frame(frame)
+                slot.processed += 1
+                session_registry.resize(session_id)
+            except PoolSaturatedError:
+                # Treat as a dropped frame; the next one will be tried instead
+                slot.dropped += 1
+                continue
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            
+            result['frames'] = slot.stats()
+            await websocket.send_json(result)
+    
+    analyzer = asyncio.create_task(analyze_frames())
+    try:
+        while True:
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                break
+            if message.get('bytes'):
+                slot.put(message['bytes'])
+    except WebSocketDisconnect:
+        pass
+    finally:
+        slot.close()
+        analyzer.cancel()
+
+@app.websocket("/ws/stt/{session_id}")
+async def speech_stream(websocket: WebSocket, session_id: str):
+    """
+    Transcribe answer audio streamed from the browser.
+    
+    The client sends 16 kHz mono int16 PCM as binary messages and receives
+    {"type": "partial"|"final", "text": ...} events as recognition progresses.
+    An answer ends after VAD silence or when the client sends the text
+    message "end"; the server then replies {"type": "transcript", ...} and the
+    transcript is handed to /record_answer (source="client") for scoring.
+    The connection can stay open for the following answers.
+    """
+    interview_controller = session_registry.get(session_id)
+    if interview_controller is None:
+        await websocket.close(code=4404)
+        return
+    
+    await websocket.accept()
+    loop = asyncio.get_running_loop()
+    try:
+        recognizer = await loop.run_in_executor(None, recognizer_pool.acquire, 10)
+    except TimeoutError:
+        await websocket.close(code=1013)  # try again later
+        return
+    
+    audio_handler = interview_controller.audio_handler
+    
+    def new_transcriber() -> StreamingTranscriber:
+        return StreamingTranscriber(recognizer, interview_controller.session.sample_rate)
+    
+    async def finish_answer(transcriber: StreamingTranscriber):
+        text = await loop.run_in_executor(None, transcriber.finish)
+        recognizer.Reset()
+        if answer_buffer is not None:
+            audio_handler.archive_answer(answer_buffer, text)
+        audio_handler.submit_client_transcript(text)
+        await websocket.send_json({'type': 'transcript', 'text': text})
+    
+    transcriber = new_transcriber()
+    # Only held while an answer is streaming, not between answers
+    answer_buffer = None
+    try:
+        while True:
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                break
+            
+            if message.get('bytes'):
+                if answer_buffer is None:
+                    answer_buffer = interview_controller.session.acquire_answer_buffer()
+                answer_buffer.write(message['bytes'])
+                # Recognition runs off the event loop; awaiting keeps chunk order
+                event = await loop.run_in_executor(None, transcriber.feed, message['bytes'])
+                if event:
+                    await websocket.send_json(event)
+                if not transcriber.end_of_answer:
+                    continue
+            elif message.get('text', '').strip() != 'end':
+                continue
+            
+            await finish_answer(transcriber)
+            transcriber = new_transcriber()
+            if answer_buffer is not None:
+                interview_controller.session.release_answer_buffer(answer_buffer)
+                answer_buffer = None
+            session_registry.get(session_id)  # keep the session alive
+            session_registry.resize(session_id)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if answer_buffer is not None:
+            interview_controller.session.release_answer_buffer(answer_buffer)
+        recognizer_pool.release(recognizer)
+
 @app.post("/finish_interview")
 async def finish_interview(request: FinishInterviewRequest):
     """Finish interview and generate comprehensive report"""
-    global interview_controller
-    
-    if not interview_controller:
-        raise HTTPException(status_code=400, detail="Interview not initialized")
+    interview_controller = get_controller(request.session_id)
     
     try:
-        # Generate final report
-        emotion_summary = interview_controller.emotion_analyzer.get_emotion_summary()
-        final_report = interview_controller.report_generator.generate_comprehensive_report(
-            interview_controller.session,
-            interview_controller.answer_scores,
-            emotion_summary
-        )
+        async with session_registry.session(request.session_id):
+            # The flow has moved on; no follow-up will be asked
+            interview_controller.discard_follow_up()
+            
+            # Only scores still being computed in the background are awaited
+            await interview_controller.scoring.drain()
+            
+            # Generate final report
+            emotion_summary = interview_controller.emotion_analyzer.get_emotion_summary()
+            final_report = await interview_controller.report_generator.agenerate_comprehensive_report(
+                interview_controller.session,
+                interview_controller.answer_scores,
+                emotion_summary
+            )
+        
+        record_scoring_usage(Config.SCORING_MODE, interview_controller.report_generator.scorer.usage())
         
-        # Cleanup audio resources
-        interview_controller.session.cleanup()
+        # Drop the session; eviction cleans up audio resources
+        session_registry.remove(request.session_id)
         
         return JSONResponse(content={
             'success': True,
             'report': final_report
         })
         
+    except PoolSaturatedError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to finish interview: {str(e)}")
 
@@ -217,13 +604,9 @@ async def test_audio():
     """Test audio system functionality"""
     try:
         from app.src.utils import InterviewSession
-        test_session = InterviewSession("Test")
         
-        # Test audio devices
-        devices_ok = test_session.test_audio_devices()
-        
-        # Cleanup
-        test_session.cleanup()
+        # Test audio devices without building a session
+        devices_ok = InterviewSession.test_audio_devices()
         
         return JSONResponse(content={
             'success': devices_ok,
@@ -238,8 +621,18 @@ async def test_audio():
 async def analyze_frame(request: ImageAnalysisRequest):
     """Legacy endpoint for emotion analysis"""
     try:
-        result = deepface_analyzer.analyze_base64_image(request.image)
+        # Demographics are only reused within a live interview; anonymous
+        # callers share the default session_id, so they get no cache
+        interview_controller = session_registry.get(request.session_id)
+        demographics_cache = (
+            interview_controller.emotion_analyzer.demographics_cache if interview_controller else None
+        )
+        result = await deepface_analyzer.aanalyze_base64_image(
+            request.image, request.actions, demographics_cache
+        )
         return JSONResponse(content=result)
+    except PoolSaturatedError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -255,20 +648,68 @@ async def get_emotion_feedback(request: FeedbackRequest):
 @app.get("/api/camera-test")
 async def camera_test():
     """Test camera and DeepFace availability"""
-    return {"status": "Camera integration ready", "deepface_available": True}
+    return {"status": "Camera integration ready", "deepface_available": readiness.is_ready("deepface")}
 
 @app.get("/health")
 async def health_check():
     """Health check for all services"""
     return {
-        "status": "healthy",
+        "status": "healthy" if readiness.is_ready() else "starting",
         "services": {
-            "deepface": True,
-            "interview_system": True,
-            "audio_processing": True
+            "deepface": readiness.is_ready("deepface"),
+            "interview_system": readiness.is_ready("llm_client"),
+            "audio_processing": readiness.is_ready("vosk")
         }
     }
 
+@app.get("/health/live")
+async def liveness():
+    """Liveness: the process is up and serving the event loop"""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness: every required model is loaded and has run a dummy inference"""
+    ready = readiness.is_ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "models": readiness.report()}
+    )
+
+@app.get("/metrics/session/{session_id}")
+async def session_metrics(session_id: str):
+    """Frame pipeline and scoring statistics for a single interview session"""
+    interview_controller = get_controller(session_id)
+    return {
+        **interview_controller.emotion_analyzer.get_pipeline_stats(),
+        'scoring': interview_controller.report_generator.scorer.usage()
+    }
+
+@app.get("/metrics")
+async def metrics():
+    """Runtime statistics for sessions, speech recognition and worker pools"""
+    return {
+        "sessions": session_registry.stats(),
+        "stt": {
+            **recognizer_pool.stats(),
+            "endpoint_latency": endpoint_latency.stats(),
+            "vad": vad_totals()
+        },
+        "tts_cache": tts_cache.stats(),
+        "answer_archive": {**answer_archiver.stats(), "buffers": answer_buffers.stats()},
+        "llm": llm_client.stats(),
+        "question_bank": question_bank.stats(),
+        "scoring": {"mode": Config.SCORING_MODE, **scoring_stats()},
+        "interview_flow": {
+            "question_gap": question_gap.stats(),
+            "follow_up": {"prefetch": Config.FOLLOW_UP_PREFETCH, **follow_up_stats}
+        },
+        "executors": {
+            "inference": inference_executor.stats()
+        },
+        "emotion_batching": deepface_analyzer.batcher.stats() if deepface_analyzer.batcher else None
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, debug=True)
@@ -0,0 +1,249 @@
+import json
+import os
+import queue
+import threading
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.config import Config
+from app.src.sessions import is_valid_session_id
+
+
+class PCMRingBuffer:
+    """
+    Preallocated int16 ring buffer holding the audio of one answer.
+
+    Capacity is fixed at construction (`max_seconds` of audio), so memory per
+    session is bounded no matter how long an answer runs; once full, the
+    oldest samples are overwritten and counted in `dropped_samples`. `write`
+    only copies into the existing array, so it is cheap enough to call from
+    the recognition loop for every block.
+    """
+
+    def __init__(self, max_seconds: float = Config.ARCHIVE_MAX_SECONDS, sample_rate: int = 16000):
+        self.sample_rate = sample_rate
+        self.capacity = int(max_seconds * sample_rate)
+        self._data = np.zeros(self.capacity, dtype=np.int16)
+        self._write_pos = 0
+        self._length = 0
+        self.dropped_samples = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    @property
+    def duration(self) -> float:
+        return self._length / self.sample_rate
+
+    def write(self, chunk: bytes):
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        if len(samples) >= self.capacity:
+            self.dropped_samples += self._length + len(samples) - self.capacity
+            self._data[:] = samples[-self.capacity:]
+            self._write_pos = 0
+            self._length = self.capacity
+            return
+
+        end = self._write_pos + len(samples)
+        if end <= self.capacity:
+            self._data[self._write_pos:end] = samples
+        else:
+            split = self.capacity - self._write_pos
+            self._data[self._write_pos:] = samples[:split]
+            self._data[:end - self.capacity] = samples[split:]
+        self._write_pos = end % self.capacity
+
+        overflow = self._length + len(samples) - self.capacity
+        if overflow > 0:
+            self.dropped_samples += overflow
+        self._length = min(self._length + len(samples), self.capacity)
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the buffered audio in chronological order"""
+        start = (self._write_pos - self._length) % self.capacity
+        if start + self._length <= self.capacity:
+            return self._data[start:start + self._length].copy()
+        return np.concatenate([self._data[start:], self._data[:self._write_pos]])
+
+    def reset(self):
+        self._write_pos = 0
+        self._length = 0
+        self.dropped_samples = 0
+
+
+class PCMBufferPool:
+    """
+    Small free list of PCMRingBuffers shared by all sessions.
+
+    A recording takes a buffer when an answer starts and hands it back once
+    the archive snapshot is taken, so sessions waiting between answers hold
+    no audio memory. At most `max_idle` released buffers are kept for reuse;
+    the rest are left to the garbage collector.
+    """
+
+    def __init__(self, max_idle: int = 4, max_seconds: float = Config.ARCHIVE_MAX_SECONDS):
+        self.max_idle = max_idle
+        self.max_seconds = max_seconds
+        self._idle = []
+        self._lock = threading.Lock()
+        self.allocated = 0
+        self.reused = 0
+        self.in_use = 0
+
+    def acquire(self, sample_rate: int = 16000) -> PCMRingBuffer:
+        with self._lock:
+            self.in_use += 1
+            for i, buffer in enumerate(self._idle):
+                if buffer.sample_rate == sample_rate:
+                    self.reused += 1
+                    return self._idle.pop(i)
+            self.allocated += 1
+        return PCMRingBuffer(self.max_seconds, sample_rate)
+
+    def release(self, buffer: PCMRingBuffer):
+        buffer.reset()
+        with self._lock:
+            self.in_use -= 1
+            if len(self._idle) < self.max_idle:
+                self._idle.append(buffer)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'in_use': self.in_use,
+                'idle': len(self._idle),
+                'allocated': self.allocated,
+                'reused': self.reused
+            }
+
+
+class AnswerArchiver:
+    """
+    Background FLAC writer for completed answers.
+
+    `submit` snapshots an answer and enqueues it without blocking; a single
+    daemon thread encodes it with soundfile to
+    `{directory}/{session_id}/q{question_index}.flac` and appends a line to
+    that session's `index.jsonl`. When the queue is full the answer is
+    dropped (and counted) rather than stalling recognition.
+    """
+
+    def __init__(self, directory: str = Config.ARCHIVE_DIR, max_pending: int = 64,
+                 enabled: bool = Config.ARCHIVE_ENABLED):
+        self.directory = directory
+        self.enabled = enabled
+        self._queue: "queue.Queue[Dict]" = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.bytes_written = 0
+        self.audio_seconds = 0.0
+
+    def submit(self, session_id: str, question_index: int, buffer: PCMRingBuffer,
+               transcript: str = "") -> bool:
+        if not self.enabled or buffer.duration == 0:
+            return False
+        if not is_valid_session_id(session_id):
+            print(f"⚠️ Not archiving answer for invalid session id {session_id!r}")
+            return False
+
+        job = {
+            'session_id': session_id,
+            'question_index': question_index,
+            'pcm': buffer.snapshot(),
+            'sample_rate': buffer.sample_rate,
+            'truncated_seconds': round(buffer.dropped_samples / buffer.sample_rate, 3),
+            'transcript': transcript,
+            'recorded_at': time.time()
+        }
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(job)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            print(f"⚠️ Answer archive queue full, dropped {session_id} q{question_index}")
+            return False
+
+    def path_for(self, session_id: str, question_index: int) -> str:
+        """Archive path for an answer; refuses ids that would leave the archive directory"""
+        if not is_valid_session_id(session_id):
+            raise ValueError(f"Invalid session id for archive: {session_id!r}")
+        root = os.path.realpath(self.directory)
+        path = os.path.realpath(os.path.join(root, session_id, f"q{int(question_index)}.flac"))
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError(f"Archive path escapes {self.directory}: {session_id!r}")
+        return path
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="answer-archiver", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                self._write(job)
+            except Exception as e:
+                self.failed += 1
+                print(f"❌ Failed to archive answer {job['session_id']} q{job['question_index']}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, job: Dict):
+        import soundfile as sf
+
+        path = self.path_for(job['session_id'], job['question_index'])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sf.write(path, job['pcm'], job['sample_rate'], format='FLAC', subtype='PCM_16')
+
+        size = os.path.getsize(path)
+        duration = len(job['pcm']) / job['sample_rate']
+        entry = {
+            'session_id': job['session_id'],
+            'question_index': job['question_index'],
+            'path': path,
+            'audio_seconds': round(duration, 3),
+            'truncated_seconds': job['truncated_seconds'],
+            'bytes': size,
+            'transcript': job['transcript'],
+            'recorded_at': job['recorded_at']
+        }
+        with open(os.path.join(os.path.dirname(path), 'index.jsonl'), 'a') as index_file:
+            index_file.write(json.dumps(entry) + "\n")
+
+        self.written += 1
+        self.bytes_written += size
+        self.audio_seconds += duration
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until queued answers are written (used at shutdown)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+
+    def stats(self) -> Dict:
+        return {
+            'enabled': self.enabled,
+            'pending': self._queue.qsize(),
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'bytes_written': self.bytes_written,
+            'audio_seconds': round(self.audio_seconds, 1),
+            'compression_ratio': round(self.audio_seconds * 32000 / self.bytes_written, 2) if self.bytes_written else None
+        }
+
+
+# Global answer archiver and recording buffer pool
+answer_archiver = AnswerArchiver()
+answer_buffers = PCMBufferPool()
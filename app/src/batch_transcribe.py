@@ -0,0 +1,142 @@
+"""
+Batch re-transcription of recorded answers.
+
+Fans WAV/FLAC files out across a process pool in which every worker loads
+the Vosk model once (in the pool initializer) and reuses it for all files it
+is handed. Results stream back as they finish, one JSON object per file, so
+throughput scales with the number of cores rather than the GIL.
+
+Usage:
+    python -m app.src.batch_transcribe archive/ --workers 8 > transcripts.jsonl
+    python -m app.src.batch_transcribe a.flac b.wav --output transcripts.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app.src.stt import VOSK_MODEL_PATH
+
+AUDIO_EXTENSIONS = ('.wav', '.flac')
+
+# Per-worker model, set by _init_worker
+_worker_model = None
+
+
+def _init_worker(model_path: str):
+    global _worker_model
+    from app.src.stt import get_vosk_model
+    _worker_model = get_vosk_model(model_path)
+
+
+def transcribe_file(path: str, block_seconds: float = 0.5) -> Dict:
+    """Transcribe one audio file with this process's model (runs in a worker)"""
+    import soundfile as sf
+    from vosk import KaldiRecognizer
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        audio, sample_rate = sf.read(path, dtype='int16', always_2d=True)
+        if audio.shape[1] > 1:
+            audio = audio.mean(axis=1).astype('int16')
+        else:
+            audio = audio[:, 0]
+
+        recognizer = KaldiRecognizer(_worker_model, sample_rate)
+        parts: List[str] = []
+        block = max(int(sample_rate * block_seconds), 1)
+        for offset in range(0, len(audio), block):
+            if recognizer.AcceptWaveform(audio[offset:offset + block].tobytes()):
+                parts.append(json.loads(recognizer.Result()).get("text", ""))
+        parts.append(json.loads(recognizer.FinalResult()).get("text", ""))
+
+        duration = len(audio) / sample_rate
+        wall_seconds = time.perf_counter() - start
+        return {
+            'path': path,
+            'success': True,
+            'transcript': " ".join(part for part in parts if part),
+            'audio_seconds': round(duration, 3),
+            'wall_seconds': round(wall_seconds, 3),
+            'cpu_seconds': round(time.process_time() - cpu_start, 3),
+            'rtf': round(wall_seconds / duration, 4) if duration else None,
+            'worker_pid': os.getpid()
+        }
+    except Exception as e:
+        return {
+            'path': path,
+            'success': False,
+            'error': str(e),
+            'wall_seconds': round(time.perf_counter() - start, 3),
+            'worker_pid': os.getpid()
+        }
+
+
+def find_audio_files(paths: Iterable[str]) -> List[str]:
+    """Expand directories (recursively) into the audio files they contain"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names)
+                             if name.lower().endswith(AUDIO_EXTENSIONS))
+        else:
+            files.append(path)
+    return files
+
+
+def transcribe_files(paths: Iterable[str], workers: Optional[int] = None,
+                     model_path: str = VOSK_MODEL_PATH) -> Iterator[Dict]:
+    """Transcribe files in parallel, yielding each result as soon as it is ready"""
+    files = find_audio_files(paths)
+    if not files:
+        return
+
+    # Largest files first so a long recording doesn't finish last on its own
+    files.sort(key=lambda path: os.path.getsize(path) if os.path.exists(path) else 0, reverse=True)
+    workers = min(workers or os.cpu_count() or 1, len(files))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(model_path,)) as executor:
+        futures = [executor.submit(transcribe_file, path) for path in files]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help="audio files or directories of .wav/.flac files")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--model', default=VOSK_MODEL_PATH, help="Vosk model directory")
+    parser.add_argument('--output', default=None, help="JSONL output file (default: stdout)")
+    args = parser.parse_args()
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    start = time.perf_counter()
+    done = failed = 0
+    audio_seconds = 0.0
+    try:
+        for result in transcribe_files(args.paths, args.workers, args.model):
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+            done += 1
+            if result['success']:
+                audio_seconds += result['audio_seconds']
+            else:
+                failed += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ Transcribed {done - failed}/{done} files ({audio_seconds:.1f}s audio) in {elapsed:.1f}s"
+          f" - {audio_seconds / elapsed if elapsed else 0:.1f}x real time", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
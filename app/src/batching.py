@@ -0,0 +1,100 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+class EmotionBatcher:
+    """
+    Micro-batching scheduler for emotion classification.
+
+    Face crops submitted from any session are collected for up to `window_ms`
+    (or until `max_batch` crops are waiting) and classified together in one
+    forward pass on a dedicated thread. Each caller gets a Future resolved
+    with its own result.
+    """
+
+    def __init__(self, classify_fn: Callable[[List[np.ndarray]], List[Dict]],
+                 max_batch: int = 32, window_ms: float = 15):
+        self.classify_fn = classify_fn
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self.forward_seconds = 0.0
+
+    def submit(self, crop: np.ndarray) -> Future:
+        self._ensure_started()
+        future = Future()
+        self._queue.put((crop, future))
+        return future
+
+    def classify(self, crop: np.ndarray, timeout: float = 10) -> Dict:
+        """Blocking convenience wrapper around submit()"""
+        return self.submit(crop).result(timeout=timeout)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="emotion-batcher", daemon=True)
+                self._thread.start()
+
+    def _collect(self) -> list:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            crops = [crop for crop, _ in batch]
+            futures = [future for _, future in batch]
+
+            start = time.perf_counter()
+            try:
+                results = self.classify_fn(crops)
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            elapsed = time.perf_counter() - start
+
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+            with self._stats_lock:
+                self.batches += 1
+                self.items += len(batch)
+                self.largest_batch = max(self.largest_batch, len(batch))
+                self.forward_seconds += elapsed
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            return {
+                'window_ms': self.window * 1000,
+                'max_batch': self.max_batch,
+                'batches': self.batches,
+                'frames': self.items,
+                'avg_batch_size': round(self.items / self.batches, 2) if self.batches else 0,
+                'largest_batch': self.largest_batch,
+                'avg_forward_ms': round(self.forward_seconds / self.batches * 1000, 2) if self.batches else 0,
+                'queued': self._queue.qsize()
+            }
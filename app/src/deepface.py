@@ -1,22 +1,202 @@
-from deepface import DeepFace
+import asyncio
 import cv2
 import numpy as np
 import base64
 from io import BytesIO
 from PIL import Image
 import json
+import threading
+import time
 from typing import Dict, List, Optional
 
+from app.config import Config
+from app.src.batching import EmotionBatcher
+from app.src.executors import inference_executor
+from app.src.tracking import FaceTracker
+
+# Output order of DeepFace's facial expression model
+EMOTION_LABELS = ['angry', 'disgust', 'fear', 'happy', 'sad', 'surprise', 'neutral']
+
+ALL_ACTIONS = ['emotion', 'age', 'gender', 'race']
+DEMOGRAPHIC_ACTIONS = ['age', 'gender', 'race']
+
+# DeepFace result keys produced by each demographic action
+DEMOGRAPHIC_KEYS = {
+    'age': ['age'],
+    'gender': ['dominant_gender', 'gender'],
+    'race': ['dominant_race', 'race']
+}
+
+class DemographicsCache:
+    """
+    Per-session cache of age/gender/race.
+    
+    These barely change during an interview, so they are recomputed only every
+    `refresh_seconds` while emotion runs on every frame.
+    """
+    
+    def __init__(self, refresh_seconds: float = Config.DEMOGRAPHICS_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._values: Dict[str, Dict] = {}
+        self._updated_at: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, actions: List[str]) -> Optional[Dict]:
+        """Cached values for all of `actions`, or None if any is missing/stale"""
+        now = time.monotonic()
+        if all(now - self._updated_at.get(action, float('-inf')) < self.refresh_seconds for action in actions):
+            self.hits += 1
+            merged = {}
+            for action in actions:
+                merged.update(self._values[action])
+            return merged
+        self.misses += 1
+        return None
+    
+    def update(self, result: Dict, actions: List[str]):
+        now = time.monotonic()
+        for action in actions:
+            self._values[action] = {key: result[key] for key in DEMOGRAPHIC_KEYS[action] if key in result}
+            self._updated_at[action] = now
+
 class DeepFaceAnalyzer:
-    def __init__(self):
+    def __init__(self, batching: bool = Config.EMOTION_BATCHING):
         self.models = {
             'emotion': 'enet_b0_8_best_vgaf',
             'age': 'Age',
             'gender': 'Gender',
             'race': 'Race'
         }
+        self.detector_backend = Config.FACE_DETECTOR_BACKEND
+        self._emotion_model = None
+        self._model_lock = threading.Lock()
         
-    def analyze_frame(self, frame: np.ndarray) -> Dict:
+        # Cross-session micro-batching of the emotion model
+        self.batcher = EmotionBatcher(
+            self.classify_emotions,
+            max_batch=Config.EMOTION_BATCH_MAX,
+            window_ms=Config.EMOTION_BATCH_WINDOW_MS
+        ) if batching else None
+    
+    def get_emotion_model(self):
+        """Build the facial expression model once and reuse it"""
+        if self._emotion_model is None:
+            with self._model_lock:
+                if self._emotion_model is None:
+                    from deepface import DeepFace
+                    self._emotion_model = DeepFace.build_model('Emotion')
+        return self._emotion_model
+    
+    def warm_up(self):
+        """Load the detector, emotion and demographic models with dummy inputs"""
+        dummy_frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        dummy_face = np.zeros((224, 224, 3), dtype=np.uint8)
+        self.detect_face(dummy_frame)
+        self.classify_emotions([dummy_face])
+        self.analyze_demographics(dummy_face)
+    
+    def detect_face(self, frame: np.ndarray) -> Dict:
+        """Detect the most prominent face and return its crop and region"""
+        from deepface import DeepFace
+        faces = DeepFace.extract_faces(
+            img_path=frame,
+            target_size=(224, 224),
+            detector_backend=self.detector_backend,
+            enforce_detection=False,
+            align=False
+        )
+        face = faces[0]
+        region = face['facial_area']
+        x, y, w, h = region['x'], region['y'], region['w'], region['h']
+        
+        return {
+            'crop': frame[y:y + h, x:x + w],
+            'region': region,
+            'confidence': face.get('confidence', 0)
+        }
+    
+    def classify_emotions(self, crops: List[np.ndarray]) -> List[Dict]:
+        """Run the emotion model on a batch of face crops in one forward pass"""
+        batch = np.stack([
+            cv2.resize(cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop, (48, 48))
+            for crop in crops
+        ]).astype(np.float32) / 255.0
+        
+        predictions = self.get_emotion_model().predict(batch[..., np.newaxis], verbose=0)
+        
+        results = []
+        for prediction in predictions:
+            total = float(prediction.sum()) or 1.0
+            scores = {
+                label: float(100 * prediction[i] / total)
+                for i, label in enumerate(EMOTION_LABELS)
+            }
+            results.append({
+                'dominant_emotion': EMOTION_LABELS[int(np.argmax(prediction))],
+                'emotion': scores
+            })
+        return results
+    
+    def analyze_demographics(self, crop: np.ndarray, actions: List[str] = DEMOGRAPHIC_ACTIONS) -> Dict:
+        """Age, gender and/or race for an already-cropped face"""
+        from deepface import DeepFace
+        result = DeepFace.analyze(
+            img_path=crop,
+            actions=list(actions),
+            detector_backend='skip',
+            enforce_detection=False
+        )
+        return result[0] if isinstance(result, list) else result
+    
+    def analyze_frame(self, frame: np.ndarray, actions: Optional[List[str]] = None,
+                      demographics_cache: Optional['DemographicsCache'] = None,
+                      tracker: Optional[FaceTracker] = None) -> Dict:
+        """
+        Analyze a frame for the requested actions (default: all four).
+        
+        With a demographics_cache, age/gender/race are reused from the cache
+        until it goes stale, so most frames only run the emotion model.
+        With a tracker, the face detector only runs every few frames and the
+        tracked crop is classified directly.
+        The response always carries every field for backward compatibility.
+        """
+        return self.finish_analysis(self.begin_analysis(frame, actions, demographics_cache, tracker))
+    
+    async def aanalyze_frame(self, frame: np.ndarray, actions: Optional[List[str]] = None,
+                             demographics_cache: Optional['DemographicsCache'] = None,
+                             tracker: Optional[FaceTracker] = None) -> Dict:
+        """
+        Async variant of analyze_frame.
+        
+        Detection and demographics run on the inference pool; the emotion
+        batch is awaited on the event loop, so waiting for a batch to fill
+        does not hold a pool thread and batches can grow past the pool size.
+        """
+        analysis = await inference_executor.run(
+            self.begin_analysis, frame, actions, demographics_cache, tracker, True
+        )
+        return await self.acomplete_analysis(analysis)
+    
+    def begin_analysis(self, frame: np.ndarray, actions: Optional[List[str]] = None,
+                       demographics_cache: Optional['DemographicsCache'] = None,
+                       tracker: Optional[FaceTracker] = None, defer_emotion: bool = False) -> Dict:
+        """
+        Blocking part of analyze_frame. With `defer_emotion` and a batcher,
+        the face crop is returned as `pending_crop` instead of classified.
+        """
+        actions = list(actions or ALL_ACTIONS)
+        unknown = set(actions) - set(ALL_ACTIONS)
+        if unknown:
+            return {'error': f"Unknown actions: {sorted(unknown)}"}
+        
+        demographic_actions = [action for action in actions if action in DEMOGRAPHIC_ACTIONS]
+        cached = demographics_cache.get(demographic_actions) if demographics_cache and demographic_actions else None
+        if cached is not None:
+            demographic_actions = []
+        
+        analysis = {'cached': cached, 'timings': {}, 'pending_crop': None}
+        timings = analysis['timings']
         try:
             # DeepFace expects RGB format
             if len(frame.shape) == 3 and frame.shape[2] == 3:
@@ -24,74 +204,142 @@ class DeepFaceAnalyzer:
             else:
                 frame_rgb = frame
             
-            # Perform analysis
-            result = DeepFace.analyze(
-                img_path=frame_rgb,
-                actions=['emotion', 'age', 'gender', 'race'],
-                enforce_detection=False
-            )
+            if 'emotion' not in actions and not demographic_actions:
+                # Everything requested is already cached
+                result = {}
+            elif self.batcher is not None or tracker is not None:
+                # Locate the face ourselves and classify only the cropped ROI
+                start = time.perf_counter()
+                face = tracker.locate(frame_rgb, self.detect_face) if tracker else self.detect_face(frame_rgb)
+                timings['detect_ms'] = round((time.perf_counter() - start) * 1000, 2)
+                timings['face_detected'] = face.get('detected', True)
+                result = {'face_confidence': face['confidence']}
+                
+                if 'emotion' in actions:
+                    if self.batcher is not None and defer_emotion:
+                        # Copied: the frame buffer may be reused once this returns
+                        analysis['pending_crop'] = np.array(face['crop'])
+                    else:
+                        start = time.perf_counter()
+                        if self.batcher is not None:
+                            result.update(self.batcher.classify(face['crop']))
+                        else:
+                            result.update(self.classify_emotions([face['crop']])[0])
+                        timings['classify_ms'] = round((time.perf_counter() - start) * 1000, 2)
+                if demographic_actions:
+                    start = time.perf_counter()
+                    result.update(self.analyze_demographics(face['crop'], demographic_actions))
+                    timings['demographics_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            else:
+                # Perform analysis
+                from deepface import DeepFace
+                start = time.perf_counter()
+                result = DeepFace.analyze(
+                    img_path=frame_rgb,
+                    actions=[action for action in actions if action == 'emotion'] + demographic_actions,
+                    enforce_detection=False
+                )
+                
+                # Extract first face if multiple faces detected
+                if isinstance(result, list):
+                    result = result[0]
+                timings['analyze_ms'] = round((time.perf_counter() - start) * 1000, 2)
             
-            # Extract first face if multiple faces detected
-            if isinstance(result, list):
-                result = result[0]
-            
-            return {
-                'success': True,
-                'emotion': result.get('dominant_emotion', 'unknown'),
-                'emotion_scores': result.get('emotion', {}),
-                'age': result.get('age', 0),
-                'gender': result.get('dominant_gender', 'unknown'),
-                'gender_scores': result.get('gender', {}),
-                'race': result.get('dominant_race', 'unknown'),
-                'race_scores': result.get('race', {}),
-                'confidence': result.get('face_confidence', 0)
-            }
+            if demographics_cache is not None and demographic_actions:
+                demographics_cache.update(result, demographic_actions)
+            analysis['result'] = result
+            return analysis
             
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'emotion': 'neutral',
-                'emotion_scores': {},
-                'age': 0,
-                'gender': 'unknown',
-                'gender_scores': {},
-                'race': 'unknown',
-                'race_scores': {},
-                'confidence': 0
-            }
+            return {'error': str(e)}
+    
+    async def acomplete_analysis(self, analysis: Dict) -> Dict:
+        """Await a deferred emotion classification on the event loop, then format"""
+        crop = analysis.get('pending_crop')
+        if crop is not None:
+            start = time.perf_counter()
+            try:
+                analysis['result'].update(await asyncio.wrap_future(self.batcher.submit(crop)))
+            except Exception as e:
+                return self._error_result(str(e))
+            analysis['timings']['classify_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        return self.finish_analysis(analysis)
+    
+    def finish_analysis(self, analysis: Dict) -> Dict:
+        if 'error' in analysis:
+            return self._error_result(analysis['error'])
+        result, cached = analysis['result'], analysis['cached']
+        if cached is not None:
+            result = {**result, **cached}
+        
+        formatted = self._format_result(result)
+        formatted['demographics_cached'] = cached is not None
+        formatted['timings'] = analysis['timings']
+        return formatted
+    
+    def _format_result(self, result: Dict) -> Dict:
+        return {
+            'success': True,
+            'emotion': result.get('dominant_emotion', 'unknown'),
+            'emotion_scores': result.get('emotion', {}),
+            'age': result.get('age', 0),
+            'gender': result.get('dominant_gender', 'unknown'),
+            'gender_scores': result.get('gender', {}),
+            'race': result.get('dominant_race', 'unknown'),
+            'race_scores': result.get('race', {}),
+            'confidence': result.get('face_confidence', 0)
+        }
+    
+    def _error_result(self, error: str) -> Dict:
+        return {
+            'success': False,
+            'error': error,
+            'emotion': 'neutral',
+            'emotion_scores': {},
+            'age': 0,
+            'gender': 'unknown',
+            'gender_scores': {},
+            'race': 'unknown',
+            'race_scores': {},
+            'confidence': 0
+        }
     
-    def analyze_base64_image(self, base64_image: str) -> Dict:
+    def analyze_base64_image(self, base64_image: str, actions: Optional[List[str]] = None,
+                             demographics_cache: Optional[DemographicsCache] = None) -> Dict:
         """
         Analyze a base64 encoded image
         """
+        return self.finish_analysis(self._begin_base64_analysis(base64_image, actions, demographics_cache))
+    
+    async def aanalyze_base64_image(self, base64_image: str, actions: Optional[List[str]] = None,
+                                    demographics_cache: Optional[DemographicsCache] = None) -> Dict:
+        """Async variant of analyze_base64_image (decoding runs on the inference pool)"""
+        analysis = await inference_executor.run(
+            self._begin_base64_analysis, base64_image, actions, demographics_cache, True
+        )
+        return await self.acomplete_analysis(analysis)
+    
+    def _begin_base64_analysis(self, base64_image: str, actions: Optional[List[str]],
+                               demographics_cache: Optional[DemographicsCache],
+                               defer_emotion: bool = False) -> Dict:
         try:
-            # Remove data URL prefix if present
-            if base64_image.startswith('data:image'):
-                base64_image = base64_image.split(',')[1]
-            
-            # Decode base64 image
-            image_data = base64.b64decode(base64_image)
-            image = Image.open(BytesIO(image_data))
-            
-            # Convert to numpy array
-            frame = np.array(image)
-            
-            return self.analyze_frame(frame)
-            
+            frame = self.decode_base64_image(base64_image)
         except Exception as e:
-            return {
-                'success': False,
-                'error': f'Failed to decode image: {str(e)}',
-                'emotion': 'neutral',
-                'emotion_scores': {},
-                'age': 0,
-                'gender': 'unknown',
-                'gender_scores': {},
-                'race': 'unknown',
-                'race_scores': {},
-                'confidence': 0
-            }
+            return {'error': f'Failed to decode image: {str(e)}'}
+        return self.begin_analysis(frame, actions, demographics_cache, defer_emotion=defer_emotion)
+    
+    @staticmethod
+    def decode_base64_image(base64_image: str) -> np.ndarray:
+        # Remove data URL prefix if present
+        if base64_image.startswith('data:image'):
+            base64_image = base64_image.split(',')[1]
+        
+        # Decode base64 image
+        image_data = base64.b64decode(base64_image)
+        image = Image.open(BytesIO(image_data))
+        
+        # Convert to numpy array
+        return np.array(image)
     
     def get_emotion_feedback(self, emotion: str, confidence: float) -> Dict:
         feedback_map = {
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from app.config import Config
+
+
+class PoolSaturatedError(Exception):
+    """Raised when an executor's queue is full and the call is rejected"""
+
+    def __init__(self, pool_name: str, retry_after: int):
+        super().__init__(f"{pool_name} pool is saturated")
+        self.pool_name = pool_name
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a hard cap on queued work.
+
+    Calls beyond `max_workers + max_queue` outstanding jobs are rejected with
+    PoolSaturatedError instead of piling up, so the API can answer 503 with a
+    Retry-After hint. Busy time and queue wait are tracked for stats().
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, retry_after: int = 2):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self.pending = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_busy = 0.0
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable on the pool and await its result"""
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PoolSaturatedError(self.name, self.retry_after)
+            self.pending += 1
+            self.submitted += 1
+
+        enqueued_at = time.monotonic()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._executor, self._call, enqueued_at, fn, args, kwargs
+            )
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def _call(self, enqueued_at: float, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        started_at = time.monotonic()
+        wait = started_at - enqueued_at
+        with self._lock:
+            self.running += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        try:
+            result = fn(*args, **kwargs)
+            with self._lock:
+                self.completed += 1
+            return result
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.total_busy += time.monotonic() - started_at
+
+    def stats(self) -> Dict:
+        with self._lock:
+            started = self.completed + self.failed + self.running
+            uptime = time.monotonic() - self._started_at
+            return {
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'running': self.running,
+                'queued': max(self.pending - self.running, 0),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'utilization': round(self.running / self.max_workers, 3),
+                'busy_ratio': round(self.total_busy / (uptime * self.max_workers), 3) if uptime else 0,
+                'avg_wait_ms': round(self.total_wait / started * 1000, 2) if started else 0,
+                'max_wait_ms': round(self.max_wait * 1000, 2)
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+# CPU-bound model inference (DeepFace / TensorFlow)
+inference_executor = BoundedExecutor(
+    "inference",
+    max_workers=Config.INFERENCE_WORKERS,
+    max_queue=Config.INFERENCE_QUEUE_SIZE
+)
@@ -0,0 +1,93 @@
+import threading
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+from app.config import Config
+
+
+class FrameDecoder:
+    """
+    Decode encoded webcam frames (JPEG/PNG/WebP) straight from the request
+    buffer.
+
+    The compressed bytes are wrapped with np.frombuffer (no copy), decoded by
+    cv2.imdecode and colour-converted into a preallocated RGB array that is
+    reused while the frame size stays the same. The returned array is only
+    valid while `lock` is held, so callers decode and analyze under it.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._rgb: Optional[np.ndarray] = None
+        self.frames_decoded = 0
+        self.bytes_decoded = 0
+
+    def decode(self, data) -> np.ndarray:
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        bgr = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+        if bgr is None:
+            raise ValueError("Could not decode image data")
+
+        # Match the channel order of the base64/PIL path (RGB)
+        if self._rgb is None or self._rgb.shape != bgr.shape:
+            self._rgb = np.empty_like(bgr)
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+
+        self.frames_decoded += 1
+        self.bytes_decoded += buffer.nbytes
+        return self._rgb
+
+
+class FrameDeduplicator:
+    """
+    Cheap change detector for consecutive webcam frames.
+
+    Each frame is reduced to a small grayscale thumbnail; if its mean
+    absolute difference from the last analyzed frame is within `threshold`
+    (on a 0-255 scale), the cached analysis result is reused instead of
+    running the models again. A result is reused at most `max_reuse` times in
+    a row so slow drifts are still picked up. A threshold of 0 disables reuse.
+    """
+
+    def __init__(self, threshold: float = Config.FRAME_DEDUP_THRESHOLD,
+                 max_reuse: int = Config.FRAME_DEDUP_MAX_REUSE, size: int = 32):
+        self.threshold = threshold
+        self.max_reuse = max_reuse
+        self.size = size
+        self._signature: Optional[np.ndarray] = None
+        self._result: Optional[Dict] = None
+        self._reuse_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def signature(self, frame: np.ndarray) -> np.ndarray:
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY) if frame.ndim == 3 else frame
+        return cv2.resize(gray, (self.size, self.size), interpolation=cv2.INTER_AREA).astype(np.int16)
+
+    def lookup(self, signature: np.ndarray) -> Optional[Dict]:
+        """Cached result if `signature` is a near-duplicate of the last analyzed frame"""
+        if (self.threshold > 0 and self._result is not None
+                and self._reuse_count < self.max_reuse
+                and float(np.abs(signature - self._signature).mean()) <= self.threshold):
+            self._reuse_count += 1
+            self.hits += 1
+            return self._result
+        self.misses += 1
+        return None
+
+    def store(self, signature: np.ndarray, result: Dict):
+        self._signature = signature
+        self._result = result
+        self._reuse_count = 0
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            'threshold': self.threshold,
+            'max_reuse': self.max_reuse,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0
+        }
@@ -1,28 +1,217 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
-from app.config import GEMINI
+import asyncio
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+from app.config import Config, GEMINI
+from app.src.executors import PoolSaturatedError
 from app.src.prompt import sys_prompt
-from langchain.prompts import PromptTemplate
+from app.src.stt import LatencyStats
+from app.src.llm_cache import ResponseCache
 import os 
 
+if TYPE_CHECKING:
+    from app.src.llm_backends import LLMBackend
 
-llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash",  
-            google_api_key= GEMINI, 
-            temperature=0.2 
-        )
+
+_llm = None
+_llm_lock = threading.Lock()
+_backend = None
+# Separate from _llm_lock: building the Gemini backend calls get_llm()
+_backend_lock = threading.Lock()
+
+
+def get_llm():
+    """Build the Gemini client on first use (keeps langchain off the import path)"""
+    global _llm
+    if _llm is None:
+        with _llm_lock:
+            if _llm is None:
+                from langchain_google_genai import ChatGoogleGenerativeAI
+                _llm = ChatGoogleGenerativeAI(
+                    model="gemini-1.5-flash",  
+                    google_api_key= GEMINI, 
+                    temperature=0.2 
+                )
+    return _llm
+
+
+class AsyncLLMClient:
+    """
+    Async access to the shared LLM backend.
+
+    Calls go through the single process-wide backend (for Gemini, `ainvoke` on
+    one client and so one HTTP/gRPC connection pool for every session).
+    Each attempt is bounded by `timeout` seconds and failures are retried up
+    to `max_retries` times with exponential backoff and full jitter. A global
+    semaphore caps in-flight requests so a burst of sessions queues here
+    instead of at the provider; once `max_queue` calls are already waiting,
+    new ones are rejected with PoolSaturatedError so the API can answer 503.
+    Successful responses are kept in a persistent ResponseCache keyed by
+    `cache_key` (or the normalized prompt) and served from it on repeat.
+    """
+
+    def __init__(self, timeout: float = Config.LLM_TIMEOUT,
+                 max_retries: int = Config.LLM_MAX_RETRIES,
+                 backoff: float = Config.LLM_RETRY_BACKOFF,
+                 max_concurrency: int = Config.LLM_MAX_CONCURRENCY,
+                 max_queue: int = Config.LLM_MAX_QUEUE,
+                 cache: Optional[ResponseCache] = None, retry_after: int = 2):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.cache = cache
+        self.latency = LatencyStats()
+        self.in_flight = 0
+        self.pending = 0
+        self.calls = 0
+        self.rejected = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.failures = 0
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def cache_key(self, parts: Sequence) -> Optional[str]:
+        return self.cache.make_key(*parts) if self.cache is not None else None
+
+    async def cached(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+        return await asyncio.to_thread(self.cache.get, key)
+
+    async def store(self, key: Optional[str], response: str):
+        if key is not None:
+            await asyncio.to_thread(self.cache.put, key, response)
+
+    async def forget(self, key: Optional[str]):
+        """Drop a cached response the caller could not use"""
+        if key is not None:
+            await asyncio.to_thread(self.cache.delete, key)
+
+    async def ainvoke(self, prompt: str, timeout: Optional[float] = None,
+                      cache_key: Optional[Sequence] = None, cache: bool = True) -> str:
+        """
+        Send one prompt and return the response text; raises after the last retry.
+
+        `cache_key` parts (e.g. template version, role, question, answer)
+        identify the response in the cache, defaulting to the prompt itself;
+        `cache=False` always calls the backend and stores nothing.
+        """
+        key = self.cache_key(cache_key or ("prompt", prompt)) if cache else None
+        content = await self.cached(key)
+        if content is not None:
+            return content
+
+        content = await self._call(prompt, timeout or self.timeout)
+        await self.store(key, content)
+        return content
+
+    async def _call(self, prompt: str, timeout: float) -> str:
+        # The first call builds the backend (imports langchain) off the loop
+        backend = _backend if _backend is not None else await asyncio.to_thread(get_backend)
+        # Shed load instead of letting callers wait on the semaphore without bound
+        if self.pending >= self.max_concurrency + self.max_queue:
+            self.rejected += 1
+            raise PoolSaturatedError("llm", self.retry_after)
+        self.calls += 1
+        self.pending += 1
+        try:
+            return await self._attempts(backend, prompt, timeout)
+        finally:
+            self.pending -= 1
+
+    async def _attempts(self, backend, prompt: str, timeout: float) -> str:
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.semaphore:
+                    self.in_flight += 1
+                    start = time.perf_counter()
+                    try:
+                        content = await asyncio.wait_for(backend.agenerate(prompt), timeout)
+                    finally:
+                        self.in_flight -= 1
+                self.latency.record(time.perf_counter() - start)
+                return content
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    self.timeouts += 1
+                if attempt == self.max_retries:
+                    self.failures += 1
+                    raise
+                self.retries += 1
+                # Full jitter keeps retries from many sessions from lining up
+                await asyncio.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+
+    def stats(self) -> Dict:
+        return {
+            'backend': Config.LLM_BACKEND,
+            'max_concurrency': self.max_concurrency,
+            'max_queue': self.max_queue,
+            'in_flight': self.in_flight,
+            'queued': max(self.pending - self.in_flight, 0),
+            'calls': self.calls,
+            'rejected': self.rejected,
+            'retries': self.retries,
+            'timeouts': self.timeouts,
+            'failures': self.failures,
+            'latency': self.latency.stats(),
+            'cache': self.cache.stats() if self.cache is not None else None
+        }
+
+
+# Global async LLM client
+llm_client = AsyncLLMClient(cache=ResponseCache() if Config.LLM_CACHE_ENABLED else None)
+
+
+def get_backend() -> "LLMBackend":
+    """The completion backend selected by Config.LLM_BACKEND, built on first use"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                from app.src.llm_backends import create_backend
+                _backend = create_backend(Config.LLM_BACKEND)
+                print(f"✅ LLM backend: {_backend.name}")
+    return _backend
+
+
+def set_backend(backend: "LLMBackend"):
+    """Swap the completion backend (benchmarks, load tests)"""
+    global _backend
+    _backend = backend
+
+
+def __getattr__(name):
+    # Backwards compatible `from app.src.llm import llm`, built lazily
+    if name == "llm":
+        return get_llm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def generate_interview_questions(role: str):
+    from langchain.prompts import PromptTemplate
+
     user_role = role
     sys_prompt =f"""
     You are a highly skilled and experienced interviewer conducting a mock interview for the position of {user_role}. Your goal is to assess the candidate's technical knowledge, problem-solving abilities, and communication skills."""
-    
+
     prompt_template = PromptTemplate(
         input_variables=["role"],
         template=sys_prompt + prompt
     )
-    
+
     formatted_prompt = prompt_template.format(role=user_role)
-    
-    response = llm(formatted_prompt)
+
+    response = get_llm()(formatted_prompt)
     return response
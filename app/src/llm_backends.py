@@ -0,0 +1,218 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+from app.config import Config
+
+
+class LLMBackendError(Exception):
+    """Raised by a backend when a completion cannot be produced"""
+
+
+class LLMBackend:
+    """Interface for text completion backends used by the LLM client"""
+    name = "base"
+
+    def generate(self, prompt: str) -> str:
+        raise NotImplementedError
+
+    async def agenerate(self, prompt: str) -> str:
+        return await asyncio.to_thread(self.generate, prompt)
+
+
+class GeminiBackend(LLMBackend):
+    """The shared langchain Gemini client"""
+    name = "gemini"
+
+    def __init__(self):
+        from app.src.llm import get_llm
+        self.client = get_llm()
+
+    def generate(self, prompt: str) -> str:
+        return self.client.invoke(prompt).content
+
+    async def agenerate(self, prompt: str) -> str:
+        return (await self.client.ainvoke(prompt)).content
+
+
+class StubBackend(LLMBackend):
+    """
+    Local stand-in for the LLM for offline load tests and benchmarks.
+
+    Each call sleeps for a latency drawn from `latency_dist` ("fixed",
+    "uniform", "normal" or "lognormal") around `latency_ms` with spread
+    `jitter_ms`, fails with probability `error_rate`, and otherwise returns a
+    well-formed response for the kind of prompt it recognises (question
+    lists, single and batch scores, follow-up questions, feedback). Response
+    text depends only on the prompt; the latency/error draws come from an RNG
+    seeded with `seed`, so runs are repeatable.
+    """
+    name = "stub"
+
+    def __init__(self, latency_ms: float = Config.LLM_STUB_LATENCY_MS,
+                 jitter_ms: float = Config.LLM_STUB_JITTER_MS,
+                 latency_dist: str = Config.LLM_STUB_LATENCY_DIST,
+                 error_rate: float = Config.LLM_STUB_ERROR_RATE,
+                 seed: int = Config.LLM_STUB_SEED):
+        if latency_dist not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown stub latency distribution '{latency_dist}'")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.latency_dist = latency_dist
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def _draw(self) -> tuple:
+        """(latency in seconds, whether this call fails)"""
+        with self._rng_lock:
+            if self.latency_dist == "uniform":
+                latency = self._rng.uniform(self.latency_ms - self.jitter_ms, self.latency_ms + self.jitter_ms)
+            elif self.latency_dist == "normal":
+                latency = self._rng.gauss(self.latency_ms, self.jitter_ms)
+            elif self.latency_dist == "lognormal" and self.latency_ms > 0:
+                # latency_ms is the median, jitter_ms the approximate spread
+                sigma = (self.jitter_ms / self.latency_ms) if self.jitter_ms else 0
+                latency = self._rng.lognormvariate(0, sigma) * self.latency_ms
+            else:
+                latency = self.latency_ms
+            failed = self._rng.random() < self.error_rate
+        return max(latency, 0) / 1000, failed
+
+    def generate(self, prompt: str) -> str:
+        latency, failed = self._draw()
+        time.sleep(latency)
+        if failed:
+            raise LLMBackendError("stub backend: injected error")
+        return self.respond(prompt)
+
+    async def agenerate(self, prompt: str) -> str:
+        latency, failed = self._draw()
+        await asyncio.sleep(latency)
+        if failed:
+            raise LLMBackendError("stub backend: injected error")
+        return self.respond(prompt)
+
+    def respond(self, prompt: str) -> str:
+        digest = int(hashlib.sha256(prompt.encode('utf-8')).hexdigest(), 16)
+        role_match = re.search(r"for (?:a |an )?(.+?) (?:position|candidate)", prompt)
+        role = role_match.group(1) if role_match else "this"
+
+        if "JSON array of questions" in prompt:
+            count_match = re.search(r"Generate (\d+)", prompt)
+            count = int(count_match.group(1)) if count_match else 5
+            return json.dumps([f"Stub question {i + 1} about {role}: describe topic {(digest >> i) % 97}?"
+                               for i in range(count)])
+
+        if "JSON array with one object per answer" in prompt:
+            answers = re.findall(r"\[(\d+)\] Answer: (.*)", prompt)
+            return json.dumps([
+                {'index': int(index), **self._score(answer)} for index, answer in answers
+            ], indent=2)
+
+        if "Return ONLY a JSON object" in prompt:
+            answer_match = re.search(r"Answer: (.*)", prompt)
+            return json.dumps(self._score(answer_match.group(1) if answer_match else ""), indent=2)
+
+        if "follow-up question" in prompt:
+            return f"Can you go deeper into point {digest % 7 + 1} of your last answer?"
+
+        return (f"Overall, the {role} candidate communicated clearly and answered every question. "
+                "Keep practising concrete examples to strengthen technical depth.")
+
+    @staticmethod
+    def _score(answer: str) -> Dict:
+        words = len(answer.split())
+        digest = int(hashlib.sha256(answer.encode('utf-8')).hexdigest(), 16)
+        return {
+            'score': min(40 + words + digest % 10, 100),
+            'feedback': "Stub feedback: answer length and structure look reasonable.",
+            'strengths': ["Responded to question"],
+            'improvements': ["Add specific examples"]
+        }
+
+
+class RecordReplayBackend(LLMBackend):
+    """
+    Captures responses of a real backend to disk and replays them offline.
+
+    Responses are stored as `{directory}/{sha256(prompt)}.json` holding the
+    prompt and the exact response text. In "record" mode every call goes to
+    `inner` and is saved; in "replay" mode responses come only from disk, so
+    a run is byte-identical to the recorded one and a prompt that was never
+    recorded raises LLMBackendError.
+    """
+    name = "record_replay"
+
+    def __init__(self, mode: str, directory: str = Config.LLM_RECORD_DIR,
+                 inner: Optional[LLMBackend] = None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown record/replay mode '{mode}'")
+        if mode == "record" and inner is None:
+            raise ValueError("record mode needs an inner backend")
+        self.mode = mode
+        self.directory = directory
+        self.inner = inner
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+    def path_for(self, prompt: str) -> str:
+        return os.path.join(self.directory, f"{self.key(prompt)}.json")
+
+    def generate(self, prompt: str) -> str:
+        if self.mode == "replay":
+            return self._replay(prompt)
+        return self._record(prompt, self.inner.generate(prompt))
+
+    async def agenerate(self, prompt: str) -> str:
+        if self.mode == "replay":
+            return await asyncio.to_thread(self._replay, prompt)
+        response = await self.inner.agenerate(prompt)
+        return await asyncio.to_thread(self._record, prompt, response)
+
+    def _replay(self, prompt: str) -> str:
+        try:
+            with open(self.path_for(prompt), encoding='utf-8') as record_file:
+                response = json.load(record_file)['response']
+        except FileNotFoundError:
+            self.missing += 1
+            raise LLMBackendError(f"No recorded response for prompt {self.key(prompt)[:12]}")
+        self.replayed += 1
+        return response
+
+    def _record(self, prompt: str, response: str) -> str:
+        path = self.path_for(prompt)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.part')
+        with os.fdopen(fd, 'w', encoding='utf-8') as record_file:
+            json.dump({'prompt': prompt, 'response': response, 'recorded_at': time.time()}, record_file)
+        os.replace(tmp_path, path)
+        self.recorded += 1
+        return response
+
+
+LLM_BACKENDS = ("gemini", "stub", "record", "replay")
+
+
+def create_backend(name: str) -> LLMBackend:
+    if name == "gemini":
+        return GeminiBackend()
+    if name == "stub":
+        return StubBackend()
+    if name == "record":
+        return RecordReplayBackend("record", inner=GeminiBackend())
+    if name == "replay":
+        return RecordReplayBackend("replay")
+    raise ValueError(f"Unknown LLM backend '{name}', expected one of {list(LLM_BACKENDS)}")
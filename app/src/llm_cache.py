@@ -0,0 +1,125 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from app.config import Config
+
+
+def normalize_key_part(part) -> str:
+    """Case and whitespace insensitive form of one key component"""
+    return " ".join(str(part).lower().split())
+
+
+class ResponseCache:
+    """
+    Persistent LLM response cache in a local sqlite3 database.
+
+    Keys are sha256 hashes of normalized key parts (typically prompt
+    template version, role, question and answer), so repeated practice runs
+    and fallback questions hit across restarts. Entries expire after `ttl`
+    seconds; when the stored responses exceed `max_bytes` the least recently
+    used ones are deleted. All access is serialized by a lock on one
+    connection; each operation is a single indexed statement.
+    """
+
+    def __init__(self, path: str = Config.LLM_CACHE_PATH, ttl: float = Config.LLM_CACHE_TTL,
+                 max_bytes: int = Config.LLM_CACHE_MAX_MB * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        return hashlib.sha256("\0".join(normalize_key_part(part) for part in parts).encode('utf-8')).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT response, size, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            response, size, created_at = row
+            if now - created_at > self.ttl:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.expired += 1
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return response
+
+    def put(self, key: str, response: str):
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._lock:
+            conn = self._connect()
+            old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, response, size, now, now)
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict(conn)
+
+    def delete(self, key: str):
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= row[0]
+
+    def _evict(self, conn: sqlite3.Connection):
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute("SELECT key, size FROM responses ORDER BY last_access LIMIT 64").fetchall()
+            if len(rows) <= 1:
+                break
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] if self._conn else None
+            lookups = self.hits + self.misses
+            return {
+                'entries': entries,
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0,
+                'expired': self.expired,
+                'evictions': self.evictions
+            }
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import random
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from app.config import Config
+from app.src.executors import PoolSaturatedError
+from app.src.llm import llm_client
+
+
+def normalize_role(role: str) -> str:
+    """Cache key for a role: case, punctuation and spacing don't matter"""
+    return re.sub(r'[^a-z0-9+#]+', ' ', role.lower()).strip()
+
+
+class QuestionPool:
+    def __init__(self, role: str, questions: List[str], ttl: float):
+        self.role = role
+        self.questions = questions
+        self.generated_at = time.monotonic()
+        self.expires_at = self.generated_at + ttl
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class QuestionBank:
+    """
+    Pre-generated interview question pools keyed by normalized role.
+
+    One LLM call fills a pool of `pool_size` questions for a role; each
+    interview then samples `count` of them at random, so starting an
+    interview for a known role needs no LLM round trip. Expired pools keep
+    serving while a replacement is generated in the background
+    (stale-while-revalidate), and `run_refresher` regenerates pools for the
+    configured and most requested roles before they expire. At most
+    `max_roles` pools are kept, least recently used first out.
+    """
+
+    def __init__(self, pool_size: int = Config.QUESTION_POOL_SIZE,
+                 ttl: float = Config.QUESTION_POOL_TTL,
+                 max_roles: int = 256, popular_roles: int = Config.QUESTION_BANK_POPULAR_ROLES):
+        self.pool_size = pool_size
+        self.ttl = ttl
+        self.max_roles = max_roles
+        self.popular_roles = popular_roles
+        self._pools: "OrderedDict[str, QuestionPool]" = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._demand = Counter()
+        self.pinned_roles: List[str] = []
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.failures = 0
+
+    async def get_questions(self, role: str, count: int = 5) -> Optional[List[str]]:
+        """Random sample of `count` questions for the role, or None if none could be generated"""
+        key = normalize_role(role)
+        pool = self._pools.get(key)
+        if pool is None:
+            self.misses += 1
+            pool = await self.refresh(role)
+            if pool is None:
+                return None
+        else:
+            self._pools.move_to_end(key)
+            if pool.fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                self.warm(role)
+
+        self._record_demand(key)
+        return random.sample(pool.questions, min(count, len(pool.questions)))
+
+    def _record_demand(self, key: str):
+        # Only roles with a pool are counted, and at most max_roles of them
+        self._demand[key] += 1
+        if len(self._demand) > self.max_roles:
+            least, _ = min(self._demand.items(), key=lambda item: item[1])
+            del self._demand[least]
+
+    def is_known(self, role: str) -> bool:
+        """Whether the role is pinned or already has a pool"""
+        key = normalize_role(role)
+        return key in self._pools or any(normalize_role(pinned) == key for pinned in self.pinned_roles)
+
+    def warm(self, role: str) -> Optional[asyncio.Task]:
+        """
+        Make sure a fresh pool exists or is being generated for a pinned or
+        already known role; unknown roles are left to get_questions.
+        """
+        if not self.is_known(role):
+            return None
+        key = normalize_role(role)
+        pool = self._pools.get(key)
+        if pool is not None and pool.fresh:
+            return None
+        return self._refresh_task(role)
+
+    async def refresh(self, role: str) -> Optional[QuestionPool]:
+        """Generate a new pool for the role (concurrent callers share one call)"""
+        return await asyncio.shield(self._refresh_task(role))
+
+    def _refresh_task(self, role: str) -> asyncio.Task:
+        key = normalize_role(role)
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.create_task(self._generate(key, role))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda done: self._refresh_done(key, done))
+        return task
+
+    def _refresh_done(self, key: str, task: asyncio.Task):
+        self._refreshing.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # saturation only matters to callers awaiting the pool
+
+    async def _generate(self, key: str, role: str) -> Optional[QuestionPool]:
+        prompt = f"""
+        Generate {self.pool_size} distinct interview questions for {role.strip()} position.
+        Cover fundamental skills, experience, technical depth and behavioral aspects.
+        Each question must stand on its own.
+        Return ONLY a JSON array of questions like this:
+        ["Question 1?", "Question 2?", "Question 3?"]
+        """
+        try:
+            # Not cached: a refresh must produce a new pool
+            content = (await llm_client.ainvoke(prompt, cache=False)).strip()
+            if content.startswith('```json'):
+                content = content[7:-3]
+            elif content.startswith('```'):
+                content = content[3:-3]
+            questions = [q.strip() for q in json.loads(content) if isinstance(q, str) and q.strip()]
+            questions = list(dict.fromkeys(questions))  # drop duplicates, keep order
+            if not questions:
+                raise ValueError("empty question list")
+        except PoolSaturatedError:
+            self.failures += 1
+            if key in self._pools:
+                return self._pools[key]
+            raise  # no pool to serve: let the request answer 503
+        except Exception as e:
+            self.failures += 1
+            print(f"❌ Question pool generation failed for '{role}': {e}")
+            return self._pools.get(key)  # keep serving the stale pool, if any
+
+        pool = QuestionPool(role.strip(), questions, self.ttl)
+        self._pools[key] = pool
+        self._pools.move_to_end(key)
+        while len(self._pools) > self.max_roles:
+            self._pools.popitem(last=False)
+        self.refreshes += 1
+        print(f"✅ Question pool ready for '{role.strip()}' ({len(questions)} questions)")
+        return pool
+
+    def pin(self, roles: Iterable[str]):
+        """Roles that are always kept warm, regardless of demand"""
+        self.pinned_roles = [role for role in roles if role.strip()]
+
+    def roles_to_refresh(self, horizon: float) -> List[str]:
+        """Pinned and most requested roles whose pool is missing or expires within `horizon`"""
+        popular = [key for key, _ in self._demand.most_common(self.popular_roles)]
+        roles = {normalize_role(role): role for role in self.pinned_roles}
+        for key in popular:
+            pool = self._pools.get(key)
+            roles.setdefault(key, pool.role if pool else key)
+
+        deadline = time.monotonic() + horizon
+        return [
+            role for key, role in roles.items()
+            if key not in self._pools or self._pools[key].expires_at <= deadline
+        ]
+
+    async def run_refresher(self, interval: float = Config.QUESTION_BANK_REFRESH_INTERVAL):
+        """Background loop keeping pinned and popular roles warm"""
+        while True:
+            roles = self.roles_to_refresh(horizon=2 * interval)
+            if roles:
+                await asyncio.gather(*(self.refresh(role) for role in roles), return_exceptions=True)
+            # Decay demand so popularity follows recent traffic
+            for key in list(self._demand):
+                self._demand[key] //= 2
+                if not self._demand[key]:
+                    del self._demand[key]
+            await asyncio.sleep(interval)
+
+    def stats(self) -> Dict:
+        served = self.hits + self.stale_hits + self.misses
+        return {
+            'roles': len(self._pools),
+            'refreshing': len(self._refreshing),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.hits + self.stale_hits) / served, 3) if served else 0,
+            'refreshes': self.refreshes,
+            'failures': self.failures,
+            'pinned_roles': self.pinned_roles
+        }
+
+
+# Global question bank instance
+question_bank = QuestionBank()
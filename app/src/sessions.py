@@ -0,0 +1,215 @@
+import asyncio
+import re
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+# Session ids end up in file paths (answer archive), so keep them path-safe
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+
+def is_valid_session_id(session_id: str) -> bool:
+    return bool(SESSION_ID_PATTERN.match(session_id or ''))
+
+
+class SessionBusyError(Exception):
+    """Raised when replacing a session while a request holds its lock"""
+
+    def __init__(self, session_id: str):
+        super().__init__(f"Session {session_id} is busy")
+        self.session_id = session_id
+
+
+class SessionEntry:
+    def __init__(self, session_id: str, value: Any, size: int):
+        self.session_id = session_id
+        self.value = value
+        self.size = size
+        self.lock = asyncio.Lock()
+        self.created_at = time.monotonic()
+        self.last_access = self.created_at
+
+
+def estimate_controller_size(controller: Any) -> int:
+    """Rough per-session memory estimate (bytes) for an InterviewController"""
+    size = 64 * 1024  # baseline for the controller object graph
+    session = getattr(controller, 'session', None)
+    if session is not None:
+        size += sum(sys.getsizeof(q) for q in session.questions)
+        size += sum(sys.getsizeof(a) for a in session.answers)
+        answer_buffer = getattr(session, 'answer_buffer', None)
+        if answer_buffer is not None:
+            size += answer_buffer.nbytes
+    emotion_analyzer = getattr(controller, 'emotion_analyzer', None)
+    if emotion_analyzer is not None:
+        # each history entry holds a timestamp, label and a 7-way score dict
+        size += len(emotion_analyzer.emotion_history) * 1024
+    size += len(getattr(controller, 'answer_scores', [])) * 2048
+    return size
+
+
+class SessionRegistry:
+    """
+    In-process registry of interview sessions keyed by session_id.
+
+    Entries are kept in LRU order and evicted when they have been idle for
+    longer than `idle_ttl` seconds, when more than `max_sessions` are live,
+    or when their estimated total size exceeds `max_memory_bytes`.
+    Each entry carries its own asyncio.Lock so requests for the same session
+    are serialised while different sessions proceed concurrently.
+    """
+
+    def __init__(self, idle_ttl: float = 1800, max_sessions: int = 500,
+                 max_memory_bytes: int = 512 * 1024 * 1024,
+                 size_of: Callable[[Any], int] = estimate_controller_size,
+                 on_evict: Optional[Callable[[Any], None]] = None):
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self.max_memory_bytes = max_memory_bytes
+        self.size_of = size_of
+        self.on_evict = on_evict
+        self._entries: "OrderedDict[str, SessionEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self.evictions = {'idle': 0, 'lru': 0, 'memory': 0}
+
+    @staticmethod
+    def new_session_id() -> str:
+        return uuid.uuid4().hex
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._entries
+
+    def put(self, session_id: str, value: Any) -> SessionEntry:
+        """
+        Register (or replace) a session and enforce capacity limits. Like
+        eviction, replacement never touches a session whose lock is held.
+        """
+        existing = self._entries.get(session_id)
+        if existing is not None and existing.lock.locked():
+            raise SessionBusyError(session_id)
+        if existing is not None:
+            old = self._remove(session_id)
+            if old.value is not value:
+                self._dispose(old)  # the replaced session is gone for good
+
+        entry = SessionEntry(session_id, value, self.size_of(value))
+        self._entries[session_id] = entry
+        self._memory_bytes += entry.size
+        self.evict_expired()
+        self._enforce_limits(keep=session_id)
+        return entry
+
+    def get(self, session_id: str) -> Optional[Any]:
+        """Return the session value and mark it as recently used"""
+        entry = self._touch(session_id)
+        return entry.value if entry else None
+
+    def remove(self, session_id: str) -> Optional[Any]:
+        entry = self._remove(session_id)
+        if entry is None:
+            return None
+        self._dispose(entry)
+        return entry.value
+
+    def resize(self, session_id: str):
+        """Re-estimate a session's size after it has grown"""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return
+        new_size = self.size_of(entry.value)
+        self._memory_bytes += new_size - entry.size
+        entry.size = new_size
+        self._enforce_limits(keep=session_id)
+
+    @asynccontextmanager
+    async def session(self, session_id: str):
+        """Acquire a session's lock for the duration of the block"""
+        entry = self._touch(session_id)
+        if entry is None:
+            raise KeyError(session_id)
+        async with entry.lock:
+            entry.last_access = time.monotonic()
+            try:
+                yield entry.value
+            finally:
+                entry.last_access = time.monotonic()
+                self.resize(session_id)
+
+    def evict_expired(self) -> int:
+        """Drop sessions idle for longer than idle_ttl; returns number evicted"""
+        now = time.monotonic()
+        expired = [
+            session_id for session_id, entry in self._entries.items()
+            if now - entry.last_access > self.idle_ttl and not entry.lock.locked()
+        ]
+        for session_id in expired:
+            self._evict(session_id, 'idle')
+        return len(expired)
+
+    async def run_sweeper(self, interval: float = 60):
+        """Periodically evict idle sessions; run as a background task"""
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_expired()
+
+    def stats(self) -> Dict:
+        return {
+            'active_sessions': len(self._entries),
+            'max_sessions': self.max_sessions,
+            'memory_bytes': self._memory_bytes,
+            'max_memory_bytes': self.max_memory_bytes,
+            'idle_ttl': self.idle_ttl,
+            'evictions': dict(self.evictions)
+        }
+
+    def _touch(self, session_id: str) -> Optional[SessionEntry]:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.last_access > self.idle_ttl and not entry.lock.locked():
+            self._evict(session_id, 'idle')
+            return None
+        entry.last_access = time.monotonic()
+        self._entries.move_to_end(session_id)
+        return entry
+
+    def _enforce_limits(self, keep: Optional[str] = None):
+        for reason, over_limit in (
+            ('lru', lambda: len(self._entries) > self.max_sessions),
+            ('memory', lambda: self._memory_bytes > self.max_memory_bytes),
+        ):
+            while over_limit():
+                victim = next(
+                    (sid for sid, entry in self._entries.items()
+                     if sid != keep and not entry.lock.locked()),
+                    None
+                )
+                if victim is None:
+                    break
+                self._evict(victim, reason)
+
+    def _evict(self, session_id: str, reason: str):
+        entry = self._remove(session_id)
+        if entry is not None:
+            self.evictions[reason] += 1
+            self._dispose(entry)
+
+    def _remove(self, session_id: str) -> Optional[SessionEntry]:
+        entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size
+        return entry
+
+    def _dispose(self, entry: SessionEntry):
+        if self.on_evict is None:
+            return
+        try:
+            self.on_evict(entry.value)
+        except Exception as e:
+            print(f"Session cleanup error for {entry.session_id}: {e}")
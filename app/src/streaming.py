@@ -0,0 +1,48 @@
+import asyncio
+from typing import Dict, Optional
+
+
+class LatestFrameSlot:
+    """
+    Single-slot mailbox with latest-frame-wins semantics.
+
+    Producers overwrite whatever frame has not been picked up yet (counting
+    it as dropped), so a slow consumer always works on the newest frame and
+    the backlog can never grow beyond one frame.
+    """
+
+    def __init__(self):
+        self._frame: Optional[bytes] = None
+        self._event = asyncio.Event()
+        self._closed = False
+        self.received = 0
+        self.processed = 0
+        self.dropped = 0
+
+    def put(self, frame: bytes):
+        if self._frame is not None:
+            self.dropped += 1
+        self._frame = frame
+        self.received += 1
+        self._event.set()
+
+    async def get(self) -> Optional[bytes]:
+        """Wait for the next frame; returns None once the slot is closed"""
+        while self._frame is None:
+            if self._closed:
+                return None
+            self._event.clear()
+            await self._event.wait()
+        frame, self._frame = self._frame, None
+        return frame
+
+    def close(self):
+        self._closed = True
+        self._event.set()
+
+    def stats(self) -> Dict:
+        return {
+            'received': self.received,
+            'processed': self.processed,
+            'dropped': self.dropped
+        }
@@ -0,0 +1,237 @@
+import json
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from app.config import Config
+from app.src.vad import EnergyVAD
+
+if TYPE_CHECKING:
+    from vosk import KaldiRecognizer, Model
+
+VOSK_MODEL_PATH = "app/models/vosk-model-small-en-us-0.15"
+
+_model_lock = threading.Lock()
+_models: Dict[str, "Model"] = {}
+_model_load_seconds: Dict[str, float] = {}
+
+
+def get_vosk_model(model_path: str = VOSK_MODEL_PATH) -> "Model":
+    """Load a Vosk model once per process and return the shared instance"""
+    model = _models.get(model_path)
+    if model is not None:
+        return model
+
+    with _model_lock:
+        model = _models.get(model_path)
+        if model is None:
+            from vosk import Model
+            start = time.perf_counter()
+            model = Model(model_path)
+            _model_load_seconds[model_path] = time.perf_counter() - start
+            _models[model_path] = model
+            print(f"✅ Loaded Vosk model {model_path} in {_model_load_seconds[model_path]:.2f}s")
+    return model
+
+
+class RecognizerPool:
+    """
+    Bounded pool of KaldiRecognizer instances sharing one Vosk model.
+
+    At most `max_size` recognizers are checked out at once; `acquire` blocks
+    (up to `timeout` seconds) when the pool is exhausted. Released
+    recognizers are reset and kept for reuse instead of being rebuilt.
+    """
+
+    def __init__(self, model_path: str = VOSK_MODEL_PATH,
+                 sample_rate: int = 16000, max_size: int = 32):
+        self.model_path = model_path
+        self.sample_rate = sample_rate
+        self.max_size = max_size
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: List["KaldiRecognizer"] = []
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+
+    def acquire(self, timeout: Optional[float] = None) -> "KaldiRecognizer":
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No speech recognizer available")
+
+        try:
+            with self._lock:
+                recognizer = self._idle.pop() if self._idle else None
+                if recognizer is not None:
+                    self.reused += 1
+            if recognizer is None:
+                from vosk import KaldiRecognizer
+                recognizer = KaldiRecognizer(get_vosk_model(self.model_path), self.sample_rate)
+                with self._lock:
+                    self.created += 1
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self.in_use += 1
+        return recognizer
+
+    def release(self, recognizer: "KaldiRecognizer"):
+        try:
+            recognizer.Reset()
+            with self._lock:
+                self._idle.append(recognizer)
+        except Exception as e:
+            # A recognizer that cannot be reset is dropped and rebuilt later
+            print(f"Recognizer reset failed: {e}")
+        finally:
+            with self._lock:
+                self.in_use -= 1
+            self._slots.release()
+
+    def warm_up(self) -> Dict:
+        """Load the model and run one recognizer over silence, returning timings"""
+        start = time.perf_counter()
+        get_vosk_model(self.model_path)
+        model_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        recognizer = self.acquire()
+        try:
+            recognizer.AcceptWaveform(bytes(self.sample_rate))  # 0.5 s of int16 silence
+            recognizer.FinalResult()
+        finally:
+            self.release(recognizer)
+        recognizer_seconds = time.perf_counter() - start
+
+        timings = {
+            'model_load_seconds': _model_load_seconds.get(self.model_path, model_seconds),
+            'warm_up_seconds': model_seconds,
+            'recognizer_seconds': recognizer_seconds
+        }
+        print(f"🔥 STT warm-up: model {timings['model_load_seconds']:.2f}s, "
+              f"recognizer {recognizer_seconds * 1000:.1f}ms")
+        return timings
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'model_loaded': self.model_path in _models,
+                'model_load_seconds': _model_load_seconds.get(self.model_path),
+                'max_size': self.max_size,
+                'in_use': self.in_use,
+                'idle': len(self._idle),
+                'created': self.created,
+                'reused': self.reused
+            }
+
+
+class LatencyStats:
+    """Rolling window of latency samples (seconds) with percentile summary"""
+
+    def __init__(self, window: int = 500):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'avg_ms': round(sum(samples) / len(samples) * 1000, 1),
+            'p50_ms': round(samples[len(samples) // 2] * 1000, 1),
+            'p95_ms': round(samples[min(int(len(samples) * 0.95), len(samples) - 1)] * 1000, 1),
+            'max_ms': round(samples[-1] * 1000, 1)
+        }
+
+
+# End of speech -> final transcript latency for live answers
+endpoint_latency = LatencyStats()
+
+class StreamingTranscriber:
+    """
+    Incremental transcription of one answer from a stream of int16 PCM chunks.
+
+    Chunks pass through an EnergyVAD first; silent chunks never reach the
+    recognizer, and the utterance is closed as soon as speech stops. `feed`
+    returns a partial/final event when the transcript changes, and
+    `end_of_answer` turns true after `end_silence` seconds of silence
+    following speech. Incoming audio is regrouped into whole VAD frames
+    before classification, so every sample reaches the recognizer according
+    to the frame it belongs to, whatever the client's chunk size.
+    """
+
+    def __init__(self, recognizer: "KaldiRecognizer", sample_rate: int = 16000,
+                 end_silence: float = Config.STT_END_SILENCE):
+        self.recognizer = recognizer
+        self.vad = EnergyVAD(sample_rate=sample_rate)
+        self.frame_bytes = self.vad.frame_len * 2  # int16
+        self.pending = b""  # audio not yet covering a whole VAD frame
+        self.end_silence = end_silence
+        self.parts: List[str] = []
+        self.last_partial = ""
+        self.was_speaking = False
+        self.last_speech_time: Optional[float] = None
+
+    @property
+    def end_of_answer(self) -> bool:
+        return self.vad.has_spoken and self.vad.silence_seconds >= self.end_silence
+
+    def feed(self, chunk: bytes) -> Optional[Dict]:
+        self.pending += chunk
+        aligned = len(self.pending) - len(self.pending) % self.frame_bytes
+        if aligned == 0:
+            return None
+        chunk, self.pending = self.pending[:aligned], self.pending[aligned:]
+
+        if not self.vad.process(chunk):
+            if self.was_speaking:
+                # Speech just ended: close the utterance now instead of
+                # waiting for Kaldi's own endpointing
+                self.was_speaking = False
+                return self._final(self.recognizer.FinalResult())
+            return None
+
+        self.was_speaking = True
+        self.last_speech_time = time.monotonic() - self.vad.since_voiced
+
+        if self.recognizer.AcceptWaveform(chunk):
+            return self._final(self.recognizer.Result())
+
+        partial_text = json.loads(self.recognizer.PartialResult()).get("partial", "")
+        if partial_text and partial_text != self.last_partial:
+            self.last_partial = partial_text
+            return {'type': 'partial', 'text': partial_text}
+        return None
+
+    def finish(self) -> str:
+        """Flush the recognizer and return the full answer transcript"""
+        if self.pending and self.was_speaking:
+            self.recognizer.AcceptWaveform(self.pending)
+        self.pending = b""
+        self._final(self.recognizer.FinalResult())
+        if self.last_speech_time is not None:
+            endpoint_latency.record(time.monotonic() - self.last_speech_time)
+        return " ".join(self.parts)
+
+    def _final(self, result_json: str) -> Optional[Dict]:
+        self.last_partial = ""
+        text = json.loads(result_json).get("text", "").strip()
+        if not text:
+            return None
+        self.parts.append(text)
+        return {'type': 'final', 'text': text}
+
+
+# Global recognizer pool instance
+recognizer_pool = RecognizerPool(max_size=Config.STT_RECOGNIZER_POOL_SIZE)
@@ -0,0 +1,112 @@
+import time
+from typing import Callable, Dict, Optional
+
+import cv2
+import numpy as np
+
+from app.config import Config
+
+
+class FaceTracker:
+    """
+    Per-session face tracker that avoids running the detector on every frame.
+
+    The full detector runs every `detect_every` frames or whenever tracking
+    fails. In between, the last detected face is followed with normalised
+    cross-correlation template matching inside a search window around the
+    previous box, which costs a fraction of a detector pass.
+    """
+
+    def __init__(self, detect_every: int = Config.FACE_DETECT_EVERY,
+                 min_match_score: float = Config.FACE_TRACK_MIN_SCORE,
+                 search_margin: float = 0.5):
+        self.detect_every = detect_every
+        self.min_match_score = min_match_score
+        self.search_margin = search_margin
+        self._region: Optional[Dict] = None
+        self._template: Optional[np.ndarray] = None
+        self._confidence = 0
+        self._frames_since_detect = 0
+        self.detections = 0
+        self.tracked = 0
+        self.track_failures = 0
+        self.detect_seconds = 0.0
+        self.track_seconds = 0.0
+
+    def locate(self, frame: np.ndarray, detect_fn: Callable[[np.ndarray], Dict]) -> Dict:
+        """Return {'crop', 'region', 'confidence', 'detected'} for this frame"""
+        if self._region is not None and self._frames_since_detect < self.detect_every:
+            start = time.perf_counter()
+            face = self._track(frame)
+            self.track_seconds += time.perf_counter() - start
+            if face is not None:
+                self.tracked += 1
+                self._frames_since_detect += 1
+                return face
+            self.track_failures += 1
+
+        start = time.perf_counter()
+        face = detect_fn(frame)
+        self.detect_seconds += time.perf_counter() - start
+        self.detections += 1
+        self._remember(frame, face)
+        return {**face, 'detected': True}
+
+    def reset(self):
+        self._region = None
+        self._template = None
+
+    def _remember(self, frame: np.ndarray, face: Dict):
+        region = face['region']
+        self._frames_since_detect = 0
+        self._confidence = face.get('confidence', 0)
+        # A zero-confidence "face" is the whole frame: nothing to track
+        if not self._confidence or region['w'] < 8 or region['h'] < 8:
+            self.reset()
+            return
+        self._region = dict(region)
+        self._template = self._gray(face['crop'])
+
+    def _track(self, frame: np.ndarray) -> Optional[Dict]:
+        region, template = self._region, self._template
+        x, y, w, h = region['x'], region['y'], region['w'], region['h']
+        frame_h, frame_w = frame.shape[:2]
+
+        margin_x, margin_y = int(w * self.search_margin), int(h * self.search_margin)
+        x0, y0 = max(x - margin_x, 0), max(y - margin_y, 0)
+        x1, y1 = min(x + w + margin_x, frame_w), min(y + h + margin_y, frame_h)
+        search = self._gray(frame[y0:y1, x0:x1])
+        if search.shape[0] < h or search.shape[1] < w:
+            return None
+
+        scores = cv2.matchTemplate(search, template, cv2.TM_CCOEFF_NORMED)
+        _, best_score, _, best_loc = cv2.minMaxLoc(scores)
+        if best_score < self.min_match_score:
+            return None
+
+        new_x, new_y = x0 + best_loc[0], y0 + best_loc[1]
+        self._region = {'x': new_x, 'y': new_y, 'w': w, 'h': h}
+        return {
+            'crop': frame[new_y:new_y + h, new_x:new_x + w],
+            'region': dict(self._region),
+            'confidence': self._confidence,
+            'detected': False,
+            'match_score': float(best_score)
+        }
+
+    @staticmethod
+    def _gray(image: np.ndarray) -> np.ndarray:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+
+    def stats(self) -> Dict:
+        located = self.detections + self.tracked
+        return {
+            'detect_every': self.detect_every,
+            'detections': self.detections,
+            'tracked': self.tracked,
+            'track_failures': self.track_failures,
+            'detector_skip_rate': round(self.tracked / located, 3) if located else 0,
+            'avg_detect_ms': round(self.detect_seconds / self.detections * 1000, 2) if self.detections else 0,
+            'avg_track_ms': round(self.track_seconds / (self.tracked + self.track_failures) * 1000, 2)
+            if (self.tracked + self.track_failures) else 0
+        }
@@ -0,0 +1,235 @@
+import array
+import asyncio
+import hashlib
+import math
+import os
+import random
+import tempfile
+import threading
+import wave
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Iterable, Optional
+
+from app.config import Config
+
+
+class TTSEngine:
+    """Interface for speech synthesizers used by TTSCache"""
+    name = "base"
+    media_type = "application/octet-stream"
+    extension = "bin"
+
+    def save(self, text: str, lang: str, voice: str, path: str):
+        raise NotImplementedError
+
+
+class GTTSEngine(TTSEngine):
+    """Google Translate TTS (network), MP3 output"""
+    name = "gtts"
+    media_type = "audio/mpeg"
+    extension = "mp3"
+
+    def save(self, text: str, lang: str, voice: str, path: str):
+        from gtts import gTTS
+        gTTS(text=text, lang=lang, tld=voice, slow=False).save(path)
+
+
+class OfflineSynthEngine(TTSEngine):
+    """
+    Local, dependency-free synthesizer producing deterministic 16 kHz WAV.
+
+    Not natural speech: vowels become voiced harmonic tones, consonants short
+    bursts of seeded noise and spaces pauses, with a duration proportional to
+    the text. It needs no network, so it suits tests, benchmarks and offline
+    development, and the same text always yields identical bytes.
+    """
+    name = "offline"
+    media_type = "audio/wav"
+    extension = "wav"
+    sample_rate = 16000
+    segment_seconds = 0.06
+
+    def save(self, text: str, lang: str, voice: str, path: str):
+        rng = random.Random(hashlib.sha256(text.encode('utf-8')).digest())
+        segment = int(self.sample_rate * self.segment_seconds)
+        samples = array.array('h')
+
+        for char in text.lower():
+            if char.isspace() or not char.isalnum():
+                samples.extend([0] * segment)
+            elif char in 'aeiouy':
+                pitch = 110 + 12 * ('aeiouy'.index(char))
+                for n in range(segment):
+                    t = n / self.sample_rate
+                    envelope = math.sin(math.pi * n / segment)
+                    value = sum(math.sin(2 * math.pi * pitch * k * t) / k for k in (1, 2, 3))
+                    samples.append(int(6000 * envelope * value))
+            else:
+                for n in range(segment // 2):
+                    samples.append(int(rng.uniform(-1, 1) * 2500 * math.sin(math.pi * n / (segment // 2))))
+                samples.extend([0] * (segment - segment // 2))
+
+        with wave.open(path, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(self.sample_rate)
+            wav_file.writeframes(samples.tobytes())
+
+
+TTS_ENGINES = {
+    GTTSEngine.name: GTTSEngine,
+    OfflineSynthEngine.name: OfflineSynthEngine
+}
+
+
+def create_engine(name: str) -> TTSEngine:
+    if name not in TTS_ENGINES:
+        raise ValueError(f"Unknown TTS engine '{name}', expected one of {sorted(TTS_ENGINES)}")
+    return TTS_ENGINES[name]()
+
+
+class TTSCache:
+    """
+    Content-addressed, size-capped disk cache of synthesized speech.
+
+    Files are named by sha256(engine, text, lang, voice), so identical
+    questions are synthesized once (and survive restarts). Access
+    order is tracked in memory and the least recently used files are deleted
+    once the directory exceeds `max_bytes`. Concurrent requests for the same
+    text share a single synthesis.
+    """
+
+    def __init__(self, engine: Optional[TTSEngine] = None,
+                 directory: str = Config.TTS_CACHE_DIR,
+                 max_bytes: int = Config.TTS_CACHE_MAX_MB * 1024 * 1024):
+        self.engine = engine or create_engine(Config.TTS_ENGINE)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._load_index()
+
+    @property
+    def media_type(self) -> str:
+        return self.engine.media_type
+
+    def key(self, text: str, lang: str = 'en', voice: str = 'com') -> str:
+        return hashlib.sha256(f"{self.engine.name}\0{lang}\0{voice}\0{text}".encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.{self.engine.extension}")
+
+    def get(self, text: str, lang: str = 'en', voice: str = 'com') -> Optional[str]:
+        """Path of the cached audio, or None on a miss"""
+        key = self.key(text, lang, voice)
+        with self._lock:
+            if key not in self._files:
+                return None
+            self._files.move_to_end(key)
+            self.hits += 1
+        return self.path_for(key)
+
+    def get_or_synthesize(self, text: str, lang: str = 'en', voice: str = 'com') -> str:
+        """Blocking: return a cached file, synthesizing it on a miss"""
+        path = self.get(text, lang, voice)
+        if path is not None:
+            return path
+
+        key = self.key(text, lang, voice)
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+        if not owner:
+            return future.result()
+
+        try:
+            path = self._synthesize(key, text, lang, voice)
+            future.set_result(path)
+            return path
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    async def prefetch(self, texts: Iterable[str], lang: str = 'en', voice: str = 'com',
+                       concurrency: int = 4):
+        """Synthesize every text not yet cached, a few at a time, in threads"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(text: str):
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(self.get_or_synthesize, text, lang, voice)
+                except Exception as e:
+                    print(f"TTS prefetch failed: {e}")
+
+        await asyncio.gather(*(fetch(text) for text in texts if self.get(text, lang, voice) is None))
+
+    def _synthesize(self, key: str, text: str, lang: str, voice: str) -> str:
+        path = self.path_for(key)
+        # Write to a temp file and rename so readers never see partial audio
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.part')
+        os.close(fd)
+        try:
+            self.engine.save(text, lang, voice, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        self._add(key, os.path.getsize(path))
+        return path
+
+    def _add(self, key: str, size: int):
+        with self._lock:
+            self._total_bytes += size - self._files.pop(key, 0)
+            self._files[key] = size
+            while self._total_bytes > self.max_bytes and len(self._files) > 1:
+                old_key, old_size = self._files.popitem(last=False)
+                self._total_bytes -= old_size
+                self.evictions += 1
+                try:
+                    os.unlink(self.path_for(old_key))
+                except OSError:
+                    pass
+
+    def _load_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith('.part'):
+                os.unlink(path)  # left over from an interrupted synthesis
+            elif name.endswith('.' + self.engine.extension):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, name.rsplit('.', 1)[0], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._add(key, size)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'engine': self.engine.name,
+                'files': len(self._files),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+# Global TTS cache instance
+tts_cache = TTSCache()
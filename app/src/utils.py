@@ -1,27 +1,27 @@
 import json
 import asyncio
-import queue
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import numpy as np
-import cv2
-import sounddevice as sd
-import soundfile as sf
-from vosk import Model, KaldiRecognizer
-from gtts import gTTS
-import pygame
-import tempfile
-import os
-import wave
 
-from app.src.deepface import deepface_analyzer
-from app.src.llm import llm
-from langchain.prompts import PromptTemplate
+# Heavy audio/ML libraries (sounddevice, pygame, gtts, vosk, deepface, langchain)
+# are imported where they are used so that importing this module stays cheap
+from app.src.deepface import deepface_analyzer, DemographicsCache
+from app.src.executors import PoolSaturatedError, inference_executor
+from app.src.llm import get_backend, llm_client
+from app.src.question_bank import question_bank
+from app.src.stt import recognizer_pool, StreamingTranscriber, LatencyStats
+from app.src.tts import tts_cache
+from app.src.archive import PCMRingBuffer, answer_archiver, answer_buffers
+from app.src.frames import FrameDecoder, FrameDeduplicator
+from app.src.tracking import FaceTracker
+from app.config import Config
 
 class InterviewSession:
-    def __init__(self, user_role: str):
+    def __init__(self, user_role: str, session_id: str = "default"):
         self.user_role = user_role
+        self.session_id = session_id
         self.questions = []
         self.answers = []
         self.emotion_data = []
@@ -34,27 +34,35 @@ class InterviewSession:
         self.channels = 1
         self.dtype = 'int16'
         
-        # Initialize components
-        self.stt_model = Model("app/models/vosk-model-small-en-us-0.15")
-        self.stt_recognizer = KaldiRecognizer(self.stt_model, self.sample_rate)
-        self.audio_queue = queue.Queue()
+        # Initialize components; recognizers come from the shared pool
+        self.stt_recognizer = None
+        self.audio_queue = asyncio.Queue()  # PCM blocks from the input stream callback
+        self.answer_buffer = None  # PCMRingBuffer, held only while an answer is recorded
         
-        # Initialize pygame for audio playback
-        pygame.mixer.init()
-        
-    def initialize_questions(self) -> List[str]:
-        """Generate initial set of core questions"""
-        prompt = f"""
+    def questions_prompt(self) -> str:
+        return f"""
         Generate 5 core interview questions for {self.user_role} position.
         Focus on fundamental skills, experience, and behavioral aspects.
         Return ONLY a JSON array of questions like this:
         ["Question 1?", "Question 2?", "Question 3?", "Question 4?", "Question 5?"]
         """
-        
-        response = llm.invoke(prompt)
+    
+    def initialize_questions(self) -> List[str]:
+        """Generate initial set of core questions"""
+        return self._set_questions(get_backend().generate(self.questions_prompt()))
+    
+    async def ainitialize_questions(self) -> List[str]:
+        """Sample core questions from the role's pre-generated pool"""
+        questions = await question_bank.get_questions(self.user_role)
+        if questions:
+            self.questions = questions
+            return self.questions
+        return self._set_questions("")  # fallback questions
+    
+    def _set_questions(self, content: str) -> List[str]:
         try:
             # Clean the response and parse JSON
-            content = response.content.strip()
+            content = content.strip()
             if content.startswith('```json'):
                 content = content[7:-3]
             elif content.startswith('```'):
@@ -75,12 +83,29 @@ class InterviewSession:
     
     def cleanup(self):
         """Clean up audio resources"""
-        # No explicit cleanup needed for sounddevice
-        pass
+        # Return a recognizer still held by an interrupted recording
+        if self.stt_recognizer is not None:
+            recognizer_pool.release(self.stt_recognizer)
+            self.stt_recognizer = None
+        # A recording still in progress owns the buffer and returns it itself
+        self.answer_buffer = None
+    
+    def acquire_answer_buffer(self) -> PCMRingBuffer:
+        """Ring buffer that captures the audio of the answer being recorded"""
+        self.answer_buffer = answer_buffers.acquire(self.sample_rate)
+        return self.answer_buffer
     
-    def test_audio_devices(self):
+    def release_answer_buffer(self, buffer: PCMRingBuffer):
+        """Hand the buffer back once the answer has been archived"""
+        answer_buffers.release(buffer)
+        if self.answer_buffer is buffer:
+            self.answer_buffer = None
+    
+    @staticmethod
+    def test_audio_devices():
         """Test and list available audio devices"""
         try:
+            import sounddevice as sd
             print("🎤 Available Audio Devices:")
             devices = sd.query_devices()
             for i, device in enumerate(devices):
@@ -98,104 +123,206 @@ class AudioHandler:
         self.current_answer = ""
         self.silence_threshold = 3.0
         self.last_speech_time = None
+        self.frame_ms = 100  # capture block size fed to the recognizer
+        self.end_silence = Config.STT_END_SILENCE  # VAD silence that ends an answer
+        self.client_transcripts = asyncio.Queue()  # answers transcribed from client audio
+    
+    def archive_answer(self, buffer: PCMRingBuffer, transcript: str):
+        """Queue the captured answer audio for FLAC archival (never blocks)"""
+        # Answers already recorded plus client transcripts not yet consumed
+        question_index = len(self.session.answers) + self.client_transcripts.qsize()
+        answer_archiver.submit(self.session.session_id, question_index, buffer, transcript)
     
     async def text_to_speech(self, text: str) -> bool:
         """Convert text to speech and play it"""
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp_file:
-                tts = gTTS(text=text, lang='en', slow=False)
-                tts.save(tmp_file.name)
-                
-                # Play the audio
-                pygame.mixer.music.load(tmp_file.name)
-                pygame.mixer.music.play()
-                
-                # Wait for playback to finish
-                while pygame.mixer.music.get_busy():
-                    await asyncio.sleep(0.1)
-                
-                # Clean up
-                os.unlink(tmp_file.name)
-                return True
+            import pygame
+            
+            # Initialize pygame for audio playback (once per process, on first use)
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            
+            # Cached audio plays immediately; a miss is synthesized off the loop
+            audio_path = tts_cache.get(text)
+            if audio_path is None:
+                audio_path = await asyncio.to_thread(tts_cache.get_or_synthesize, text)
+            
+            # Play the audio
+            pygame.mixer.music.load(audio_path)
+            pygame.mixer.music.play()
+            
+            # Wait for playback to finish
+            while pygame.mixer.music.get_busy():
+                await asyncio.sleep(0.1)
+            
+            return True
         except Exception as e:
             print(f"TTS Error: {e}")
             return False
     
     async def speech_to_text(self, max_duration: int = 120) -> str:
         """Record and convert speech to text with silence detection using sounddevice"""
+        import sounddevice as sd
+        
         self.is_recording = True
         self.current_answer = ""
-        silence_start = None
-        answer_parts = []
         
-        print("🎤 Recording... (3 seconds of silence to finish)")
+        print(f"🎤 Recording... ({self.end_silence:g} seconds of silence to finish)")
         
         # Audio recording parameters
-        chunk_duration = 0.5  # Record in 0.5 second chunks
         sample_rate = self.session.sample_rate
-        channels = self.session.channels
+        block_size = int(sample_rate * self.frame_ms / 1000)
+        
+        loop = asyncio.get_running_loop()
+        audio_queue = asyncio.Queue()
+        self.session.audio_queue = audio_queue
+        
+        def on_audio(indata, frames, time_info, status):
+            # Runs on the PortAudio thread: copy the block and hand it to the loop
+            if status:
+                print(f"Audio input status: {status}")
+            loop.call_soon_threadsafe(audio_queue.put_nowait, bytes(indata))
+        
+        self.session.stt_recognizer = await loop.run_in_executor(None, recognizer_pool.acquire, 10)
+        transcriber = StreamingTranscriber(
+            self.session.stt_recognizer, sample_rate, end_silence=self.end_silence
+        )
+        answer_buffer = self.session.acquire_answer_buffer()
         
         try:
-            start_time = time.time()
-            
-            while self.is_recording and (time.time() - start_time) < max_duration:
-                try:
-                    # Record a chunk using sounddevice
-                    audio_chunk = sd.rec(
-                        int(chunk_duration * sample_rate),
-                        samplerate=sample_rate,
-                        channels=channels,
-                        dtype=self.session.dtype
-                    )
-                    sd.wait()  # Wait for recording to complete
+            # Continuous capture: no gaps between blocks, no blocking sd.wait()
+            with sd.InputStream(
+                samplerate=sample_rate,
+                channels=self.session.channels,
+                dtype=self.session.dtype,
+                blocksize=block_size,
+                callback=on_audio
+            ):
+                start_time = time.monotonic()
+                
+                while self.is_recording and (time.monotonic() - start_time) < max_duration:
+                    try:
+                        audio_bytes = await asyncio.wait_for(audio_queue.get(), timeout=1.0)
+                    except asyncio.TimeoutError:
+                        continue
                     
-                    # Convert to bytes for Vosk
-                    audio_bytes = audio_chunk.tobytes()
+                    answer_buffer.write(audio_bytes)
+                    try:
+                        # Recognition is CPU-bound; keep it off the event loop
+                        event = await loop.run_in_executor(None, transcriber.feed, audio_bytes)
+                    except Exception as e:
+                        print(f"STT Error: {e}")
+                        break
                     
-                    if self.session.stt_recognizer.AcceptWaveform(audio_bytes):
-                        result = json.loads(self.session.stt_recognizer.Result())
-                        text = result.get("text", "").strip()
-                        
-                        if text:
-                            answer_parts.append(text)
-                            print(f"✅ Recognized: {text}")
-                            silence_start = None
-                    else:
-                        partial = json.loads(self.session.stt_recognizer.PartialResult())
-                        partial_text = partial.get("partial", "")
-                        
-                        if partial_text:
-                            print(f"⏳ Speaking: {partial_text}")
-                            silence_start = None
-                        else:
-                            # No speech detected
-                            if silence_start is None:
-                                silence_start = time.time()
-                            elif time.time() - silence_start >= self.silence_threshold:
-                                print("🔇 Silence detected. Finishing recording...")
-                                break
-                                
-                except Exception as e:
-                    print(f"STT Error: {e}")
-                    break
+                    if event and event['type'] == 'final':
+                        print(f"✅ Recognized: {event['text']}")
+                    elif event:
+                        print(f"⏳ Speaking: {event['text']}")
                     
+                    if transcriber.end_of_answer:
+                        print("🔇 Silence detected. Finishing recording...")
+                        break
+                    if not transcriber.vad.has_spoken and time.monotonic() - start_time >= self.silence_threshold:
+                        print("🔇 No speech detected. Finishing recording...")
+                        break
+            
+            # Flush whatever the recognizer still buffers
+            self.current_answer = await loop.run_in_executor(None, transcriber.finish)
+            self.last_speech_time = transcriber.last_speech_time
+            self.archive_answer(answer_buffer, self.current_answer)
+                
         finally:
-            # No explicit cleanup needed for sounddevice
-            pass
+            self.session.release_answer_buffer(answer_buffer)
+            # Hand the recognizer back to the pool for the next answer
+            if self.session.stt_recognizer is not None:
+                recognizer_pool.release(self.session.stt_recognizer)
+                self.session.stt_recognizer = None
         
         self.is_recording = False
-        self.current_answer = " ".join(answer_parts)
         return self.current_answer
+    
+    def submit_client_transcript(self, text: str):
+        """Hand over a transcript produced from client-streamed audio"""
+        self.client_transcripts.put_nowait(text)
+    
+    async def wait_client_transcript(self, timeout: float = 60) -> str:
+        """Wait for the next transcript from the client audio WebSocket"""
+        return await asyncio.wait_for(self.client_transcripts.get(), timeout)
 
 class EmotionAnalyzer:
     def __init__(self):
         self.emotion_history = []
+        self.frame_decoder = FrameDecoder()
+        self.demographics_cache = DemographicsCache()
+        self.face_tracker = FaceTracker()
+        self.deduplicator = FrameDeduplicator()
         
-    def analyze_webcam_frame(self, frame: np.ndarray) -> Dict:
+    def analyze_webcam_frame(self, frame: np.ndarray, actions: Optional[List[str]] = None) -> Dict:
         """Analyze emotion from webcam frame"""
-        result = deepface_analyzer.analyze_frame(frame)
+        # Near-duplicate frames reuse the last result without running any model
+        signature = self.deduplicator.signature(frame)
+        cached = self.deduplicator.lookup(signature) if actions is None else None
+        if cached is not None:
+            result = {**cached, 'reused': True}
+        else:
+            # Emotion runs every frame; age/gender/race come from the session cache
+            result = deepface_analyzer.analyze_frame(
+                frame, actions, self.demographics_cache, self.face_tracker
+            )
+            if result['success'] and actions is None:
+                self.deduplicator.store(signature, result)
+            result['reused'] = False
+        
+        self._record(result)
+        return result
+    
+    def analyze_encoded_frame(self, data: bytes) -> Dict:
+        """Decode a JPEG/PNG frame from raw bytes and analyze it"""
+        with self.frame_decoder.lock:
+            frame = self.frame_decoder.decode(data)
+            return self.analyze_webcam_frame(frame)
+    
+    async def aanalyze_webcam_frame(self, frame: np.ndarray, actions: Optional[List[str]] = None) -> Dict:
+        """
+        Async variant of analyze_webcam_frame: blocking work runs on the
+        inference pool, the batched emotion result is awaited on the loop.
+        """
+        prepared = await inference_executor.run(self._prepare_frame, frame, actions)
+        return await self._complete_frame(prepared)
+    
+    async def aanalyze_encoded_frame(self, data: bytes) -> Dict:
+        """Async variant of analyze_encoded_frame"""
+        prepared = await inference_executor.run(self._prepare_encoded_frame, data)
+        return await self._complete_frame(prepared)
+    
+    def _prepare_encoded_frame(self, data: bytes) -> Dict:
+        with self.frame_decoder.lock:
+            return self._prepare_frame(self.frame_decoder.decode(data))
+    
+    def _prepare_frame(self, frame: np.ndarray, actions: Optional[List[str]] = None) -> Dict:
+        signature = self.deduplicator.signature(frame)
+        cached = self.deduplicator.lookup(signature) if actions is None else None
+        if cached is not None:
+            return {'reused': cached}
+        analysis = deepface_analyzer.begin_analysis(
+            frame, actions, self.demographics_cache, self.face_tracker, defer_emotion=True
+        )
+        return {'signature': signature, 'actions': actions, 'analysis': analysis}
+    
+    async def _complete_frame(self, prepared: Dict) -> Dict:
+        if 'reused' in prepared:
+            result = {**prepared['reused'], 'reused': True}
+        else:
+            result = await deepface_analyzer.acomplete_analysis(prepared['analysis'])
+            if result['success'] and prepared['actions'] is None:
+                self.deduplicator.store(prepared['signature'], result)
+            result['reused'] = False
         
-        if result['success']:
+        self._record(result)
+        return result
+    
+    def _record(self, result: Dict):
+        if result['success'] and result['emotion_scores']:
             emotion_data = {
                 'timestamp': datetime.now().isoformat(),
                 'emotion': result['emotion'],
@@ -203,8 +330,6 @@ class EmotionAnalyzer:
                 'emotion_scores': result['emotion_scores']
             }
             self.emotion_history.append(emotion_data)
-            
-        return result
     
     def get_emotion_summary(self) -> Dict:
         """Get summary of emotions throughout interview"""
@@ -232,15 +357,226 @@ class EmotionAnalyzer:
             'distribution': emotion_distribution,
             'total_frames': total_frames
         }
+    
+    def get_pipeline_stats(self) -> Dict:
+        """Per-session counters for the frame analysis pipeline"""
+        return {
+            'frames_analyzed': len(self.emotion_history),
+            'face_tracking': self.face_tracker.stats(),
+            'frame_dedup': self.deduplicator.stats(),
+            'demographics_cache': {
+                'hits': self.demographics_cache.hits,
+                'misses': self.demographics_cache.misses
+            }
+        }
+
+# Process-wide LLM usage of finished interviews, per scoring mode
+_scoring_totals: Dict[str, Dict] = {}
+
+def record_scoring_usage(mode: str, usage: Dict):
+    totals = _scoring_totals.setdefault(mode, {
+        'interviews': 0, 'answers': 0, 'llm_calls': 0, 'llm_seconds': 0.0, 'prompt_tokens': 0
+    })
+    totals['interviews'] += 1
+    for key in ('answers', 'llm_calls', 'llm_seconds', 'prompt_tokens'):
+        totals[key] += usage[key]
+
+def scoring_stats() -> Dict:
+    """Average scoring cost per interview for each scoring mode"""
+    stats = {}
+    for mode, totals in _scoring_totals.items():
+        interviews = totals['interviews']
+        stats[mode] = {
+            'interviews': interviews,
+            'answers_per_interview': round(totals['answers'] / interviews, 2),
+            'llm_calls_per_interview': round(totals['llm_calls'] / interviews, 2),
+            'llm_seconds_per_interview': round(totals['llm_seconds'] / interviews, 3),
+            'prompt_tokens_per_interview': round(totals['prompt_tokens'] / interviews)
+        }
+    return stats
 
 class InterviewScorer:
+    # Bump when the scoring prompt changes so cached scores are not reused
+    prompt_version = "score-v1"
+    
     def __init__(self):
         self.emotion_weight = 0.3
         self.answer_weight = 0.7
+        # LLM usage for this interview's scoring (tokens estimated at 4 chars each)
+        self.llm_calls = 0
+        self.llm_seconds = 0.0
+        self.prompt_tokens = 0
+        self.answers_scored = 0
+        self.batch_fallbacks = 0
+        self.cache_hits = 0
+        self.empty_answers = 0
         
     def score_answer(self, question: str, answer: str, user_role: str) -> Dict:
         """Score individual answer using LLM"""
-        prompt = f"""
+        if not answer.strip():
+            return self.empty_answer_score()
+        try:
+            return self.parse_score(get_backend().generate(self.score_prompt(question, answer, user_role)))
+        except:
+            return self.fallback_score()
+    
+    async def ascore_answer(self, question: str, answer: str, user_role: str) -> Dict:
+        """Async variant of score_answer using the shared LLM client and response cache"""
+        self.answers_scored += 1
+        if not answer.strip():
+            self.empty_answers += 1
+            return self.empty_answer_score()
+        
+        key = self.score_cache_key(question, answer, user_role)
+        try:
+            content = await llm_client.cached(key)
+            if content is not None:
+                self.cache_hits += 1
+                try:
+                    return self.parse_score(content)
+                except ValueError:
+                    await llm_client.forget(key)
+            
+            content = await self._ainvoke(self.score_prompt(question, answer, user_role))
+            score = self.parse_score(content)
+            await llm_client.store(key, content)
+            return score
+        except PoolSaturatedError:
+            raise
+        except Exception:
+            return self.fallback_score()
+    
+    async def ascore_answers(self, items: List[Tuple[str, str]], user_role: str) -> List[Dict]:
+        """
+        Score several (question, answer) pairs with a single LLM call.
+        
+        The response must be a JSON array with one object per pair; each item
+        is validated on its own and only the pairs whose item is missing or
+        malformed are re-scored individually (concurrently).
+        """
+        results: List[Optional[Dict]] = [None] * len(items)
+        self.answers_scored += len(items)
+        
+        # Empty answers and cached scores never reach the batch prompt
+        keys = [self.score_cache_key(question, answer, user_role) for question, answer in items]
+        for i, (question, answer) in enumerate(items):
+            if not answer.strip():
+                self.empty_answers += 1
+                results[i] = self.empty_answer_score()
+                continue
+            content = await llm_client.cached(keys[i])
+            if content is not None:
+                try:
+                    results[i] = self.validate_score(json.loads(content))
+                except ValueError:
+                    pass
+                if results[i] is not None:
+                    self.cache_hits += 1
+        
+        batch = [i for i, result in enumerate(results) if result is None]
+        if len(batch) > 1:
+            try:
+                content = await self._ainvoke(self.batch_score_prompt([items[i] for i in batch], user_role))
+                parsed = json.loads(self._strip_fences(content))
+                if isinstance(parsed, list):
+                    for position, item in enumerate(parsed):
+                        index = item.get('index', position + 1) if isinstance(item, dict) else position + 1
+                        if isinstance(index, int) and 1 <= index <= len(batch) and results[batch[index - 1]] is None:
+                            score = self.validate_score(item)
+                            if score is not None:
+                                results[batch[index - 1]] = score
+                                await llm_client.store(keys[batch[index - 1]], json.dumps(score))
+            except PoolSaturatedError:
+                raise
+            except Exception as e:
+                print(f"Batch scoring failed, scoring answers one by one: {e}")
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            if len(batch) > 1:
+                self.batch_fallbacks += len(missing)
+            self.answers_scored -= len(missing)  # counted again by ascore_answer
+            scores = await asyncio.gather(*(
+                self.ascore_answer(items[i][0], items[i][1], user_role) for i in missing
+            ))
+            for i, score in zip(missing, scores):
+                results[i] = score
+        return results
+    
+    async def _ainvoke(self, prompt: str) -> str:
+        start = time.perf_counter()
+        self.llm_calls += 1
+        self.prompt_tokens += len(prompt) // 4
+        try:
+            # Callers consult and fill the cache per answer
+            return await llm_client.ainvoke(prompt, cache=False)
+        finally:
+            self.llm_seconds += time.perf_counter() - start
+    
+    def usage(self) -> Dict:
+        return {
+            'answers': self.answers_scored,
+            'llm_calls': self.llm_calls,
+            'llm_seconds': round(self.llm_seconds, 3),
+            'prompt_tokens': self.prompt_tokens,
+            'batch_fallbacks': self.batch_fallbacks,
+            'cache_hits': self.cache_hits,
+            'empty_answers': self.empty_answers
+        }
+    
+    def score_cache_key(self, question: str, answer: str, user_role: str) -> Optional[str]:
+        return llm_client.cache_key(("score", self.prompt_version, user_role, question, answer))
+    
+    def batch_score_prompt(self, items: List[Tuple[str, str]], user_role: str) -> str:
+        answers = "\n\n".join(
+            f"[{i}] Question: {question}\n[{i}] Answer: {answer}"
+            for i, (question, answer) in enumerate(items, 1)
+        )
+        return f"""
+        Evaluate each of these {len(items)} interview answers for a {user_role} position:
+        
+        {answers}
+        
+        For each answer provide a score from 0-100 and brief feedback. Consider:
+        - Relevance to the question
+        - Technical accuracy (if applicable)
+        - Communication clarity
+        - Depth of response
+        
+        Return ONLY a JSON array with one object per answer, in order, like this:
+        [
+            {{
+                "index": 1,
+                "score": 85,
+                "feedback": "Good technical knowledge but could provide more specific examples.",
+                "strengths": ["Clear communication", "Relevant experience"],
+                "improvements": ["Add specific examples", "More detail needed"]
+            }}
+        ]
+        """
+    
+    def validate_score(self, item) -> Optional[Dict]:
+        """Normalized score dict, or None if the item is not a usable score"""
+        if not isinstance(item, dict):
+            return None
+        score = item.get('score')
+        if isinstance(score, bool) or not isinstance(score, (int, float)) or not 0 <= score <= 100:
+            return None
+        if not isinstance(item.get('feedback'), str):
+            return None
+        strengths = item.get('strengths', [])
+        improvements = item.get('improvements', [])
+        if not isinstance(strengths, list) or not isinstance(improvements, list):
+            return None
+        return {
+            'score': score,
+            'feedback': item['feedback'],
+            'strengths': [str(s) for s in strengths],
+            'improvements': [str(s) for s in improvements]
+        }
+    
+    def score_prompt(self, question: str, answer: str, user_role: str) -> str:
+        return f"""
         Evaluate this interview answer for a {user_role} position:
         
         Question: {question}
@@ -260,24 +596,34 @@ class InterviewScorer:
             "improvements": ["Add specific examples", "More detail needed"]
         }}
         """
-        
-        try:
-            response = llm.invoke(prompt)
-            content = response.content.strip()
-            
-            if content.startswith('```json'):
-                content = content[7:-3]
-            elif content.startswith('```'):
-                content = content[3:-3]
-                
-            return json.loads(content)
-        except:
-            return {
-                "score": 70,
-                "feedback": "Answer received and processed.",
-                "strengths": ["Responded to question"],
-                "improvements": ["Could provide more detail"]
-            }
+    
+    def parse_score(self, content: str) -> Dict:
+        return json.loads(self._strip_fences(content))
+    
+    @staticmethod
+    def _strip_fences(content: str) -> str:
+        content = content.strip()
+        if content.startswith('```json'):
+            content = content[7:-3]
+        elif content.startswith('```'):
+            content = content[3:-3]
+        return content
+    
+    def empty_answer_score(self) -> Dict:
+        return {
+            "score": 0,
+            "feedback": "No answer was detected for this question.",
+            "strengths": [],
+            "improvements": ["Answer the question out loud, even briefly"]
+        }
+    
+    def fallback_score(self) -> Dict:
+        return {
+            "score": 70,
+            "feedback": "Answer received and processed.",
+            "strengths": ["Responded to question"],
+            "improvements": ["Could provide more detail"]
+        }
     
     def calculate_final_score(self, answer_scores: List[int], emotion_summary: Dict) -> Dict:
         """Calculate final interview score"""
@@ -323,7 +669,89 @@ class InterviewScorer:
         
         return min(adjusted_score, 100)
 
+class ScoringQueue:
+    """
+    Background scorer for one session's answers.
+    
+    `submit` reserves the answer's slot in `answer_scores` with a None
+    placeholder and returns a future for its score; a single worker task
+    scores submissions in order and fills the slots, so `answer_scores`
+    stays aligned with `session.answers` while the request that recorded the
+    answer returns immediately.
+    """
+    
+    def __init__(self, scorer: InterviewScorer, session: InterviewSession, answer_scores: List[Dict]):
+        self.scorer = scorer
+        self.session = session
+        self.answer_scores = answer_scores
+        self.futures: Dict[int, asyncio.Future] = {}
+        self.queue = asyncio.Queue()
+        self.worker = None
+    
+    def submit(self, question: str, answer: str) -> int:
+        """Queue an answer for scoring; returns its index in answer_scores"""
+        index = len(self.answer_scores)
+        self.answer_scores.append(None)
+        self.futures[index] = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((index, question, answer))
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(self._run())
+        return index
+    
+    async def _run(self):
+        while True:
+            index, question, answer = await self.queue.get()
+            while True:
+                try:
+                    score = await self.scorer.ascore_answer(question, answer, self.session.user_role)
+                    break
+                except PoolSaturatedError as e:
+                    # Nobody to answer 503 to here; wait for the LLM queue to drain
+                    await asyncio.sleep(e.retry_after)
+            self.answer_scores[index] = score
+            future = self.futures[index]
+            if not future.done():
+                future.set_result(score)
+    
+    def status(self, index: int) -> Optional[str]:
+        if index >= len(self.answer_scores):
+            return None
+        if self.answer_scores[index] is not None:
+            return 'done'
+        # Slots reserved without submit() are scored later (batch mode)
+        return 'pending' if index in self.futures else 'deferred'
+    
+    async def wait(self, index: int, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Score for an answer, waiting up to `timeout` seconds if still pending"""
+        future = self.futures.get(index)
+        if future is None or future.done() or not timeout:
+            return self.answer_scores[index] if index < len(self.answer_scores) else None
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    async def drain(self):
+        """Wait for every outstanding score"""
+        pending = [future for future in self.futures.values() if not future.done()]
+        if pending:
+            await asyncio.gather(*pending)
+    
+    @property
+    def outstanding(self) -> int:
+        return sum(1 for future in self.futures.values() if not future.done())
+    
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+        for future in self.futures.values():
+            if not future.done():
+                future.cancel()
+
 class ReportGenerator:
+    fallback_feedback = "Interview completed successfully. Continue practicing to improve your skills."
+    
     def __init__(self):
         self.scorer = InterviewScorer()
     
@@ -331,14 +759,49 @@ class ReportGenerator:
                                     answer_scores: List[Dict], 
                                     emotion_summary: Dict) -> Dict:
         """Generate final interview report"""
+        overall_feedback = self.generate_overall_feedback(session, answer_scores, emotion_summary)
+        return self.build_report(session, answer_scores, emotion_summary, overall_feedback)
+    
+    async def agenerate_comprehensive_report(self, session: InterviewSession,
+                                             answer_scores: List[Dict],
+                                             emotion_summary: Dict) -> Dict:
+        """
+        Async variant of generate_comprehensive_report.
+        
+        Answers that have no score yet (missing or None placeholders) are
+        scored concurrently first (the feedback prompt includes every score),
+        then overall feedback is generated; `answer_scores` is filled in place.
+        """
+        while len(answer_scores) < len(session.answers):
+            answer_scores.append(None)
+        pending = [i for i in range(len(session.answers)) if answer_scores[i] is None]
+        if pending:
+            if Config.SCORING_MODE == "batch":
+                scores = await self.scorer.ascore_answers(
+                    [(session.questions[i], session.answers[i]) for i in pending], session.user_role
+                )
+            else:
+                scores = await asyncio.gather(*(
+                    self.scorer.ascore_answer(session.questions[i], session.answers[i], session.user_role)
+                    for i in pending
+                ), return_exceptions=True)
+            # Keep the scores that did complete so a retry only redoes the rest
+            for i, score in zip(pending, scores):
+                if not isinstance(score, BaseException):
+                    answer_scores[i] = score
+            for score in scores:
+                if isinstance(score, BaseException):
+                    raise score
         
+        overall_feedback = await self.agenerate_overall_feedback(session, answer_scores, emotion_summary)
+        return self.build_report(session, answer_scores, emotion_summary, overall_feedback)
+    
+    def build_report(self, session: InterviewSession, answer_scores: List[Dict],
+                     emotion_summary: Dict, overall_feedback: str) -> Dict:
         # Calculate scores
         score_values = [score['score'] for score in answer_scores]
         final_scoring = self.scorer.calculate_final_score(score_values, emotion_summary)
         
-        # Generate overall feedback
-        overall_feedback = self.generate_overall_feedback(session, answer_scores, emotion_summary)
-        
         # Calculate interview duration
         duration = datetime.now() - session.session_start_time
         
@@ -372,13 +835,30 @@ class ReportGenerator:
                                 answer_scores: List[Dict], 
                                 emotion_summary: Dict) -> str:
         """Generate overall interview feedback using LLM"""
-        
+        try:
+            return get_backend().generate(self.feedback_prompt(session, answer_scores, emotion_summary))
+        except:
+            return self.fallback_feedback
+    
+    async def agenerate_overall_feedback(self, session: InterviewSession,
+                                         answer_scores: List[Dict],
+                                         emotion_summary: Dict) -> str:
+        """Async variant of generate_overall_feedback using the shared LLM client"""
+        try:
+            return await llm_client.ainvoke(self.feedback_prompt(session, answer_scores, emotion_summary))
+        except PoolSaturatedError:
+            raise
+        except Exception:
+            return self.fallback_feedback
+    
+    def feedback_prompt(self, session: InterviewSession, answer_scores: List[Dict],
+                        emotion_summary: Dict) -> str:
         qa_summary = "\n".join([
             f"Q: {session.questions[i]}\nA: {session.answers[i]}\nScore: {answer_scores[i]['score']}"
             for i in range(len(session.answers))
         ])
         
-        prompt = f"""
+        return f"""
         Generate overall interview feedback for a {session.user_role} candidate:
         
         Q&A Summary:
@@ -397,12 +877,6 @@ class ReportGenerator:
         
         Keep it professional and encouraging.
         """
-        
-        try:
-            response = llm.invoke(prompt)
-            return response.content
-        except:
-            return "Interview completed successfully. Continue practicing to improve your skills."
     
     def generate_recommendations(self, scoring: Dict, emotion_summary: Dict) -> List[str]:
         """Generate personalized recommendations"""
@@ -428,26 +902,58 @@ class ReportGenerator:
         
         return recommendations
 
+# Next question requested -> follow-up text and audio ready (0 when the
+# speculative follow-up was already waiting), across all interviews
+question_gap = LatencyStats()
+# Speculative follow-up questions: started, used (and ready by then), discarded
+follow_up_stats = {'started': 0, 'used': 0, 'ready_when_needed': 0, 'discarded': 0}
+
 # Main Interview Controller
 class InterviewController:
-    def __init__(self, user_role: str):
-        self.session = InterviewSession(user_role)
+    def __init__(self, user_role: str, session_id: str = "default"):
+        self.session = InterviewSession(user_role, session_id)
         self.audio_handler = AudioHandler(self.session)
         self.emotion_analyzer = EmotionAnalyzer()
         self.report_generator = ReportGenerator()
         self.answer_scores = []
+        self.scoring = ScoringQueue(self.report_generator.scorer, self.session, self.answer_scores)
+        self.prefetch_task = None
+        self.follow_up_task = None
+        self.follow_up_for = 0  # number of answers the speculative follow-up is based on
+        self.follow_ups_asked = 0
+    
+    def cleanup(self):
+        """Stop background work and release audio resources"""
+        self.discard_follow_up()
+        self.scoring.cancel()
+        self.session.cleanup()
+    
+    def prefetch_question_audio(self) -> asyncio.Task:
+        """Synthesize audio for every question in the background"""
+        self.prefetch_task = asyncio.create_task(tts_cache.prefetch(list(self.session.questions)))
+        return self.prefetch_task
         
     async def start_interview(self) -> Dict:
         """Start the complete interview process"""
         try:
             # Initialize questions
-            questions = self.session.initialize_questions()
+            questions = await self.session.ainitialize_questions()
             print(f"✅ Generated {len(questions)} questions for {self.session.user_role}")
+            self.prefetch_question_audio()
             
             self.session.is_active = True
             
             # Conduct interview
-            for i, question in enumerate(questions):
+            i = 0
+            while i < len(questions) or self.follow_up_task is not None:
+                # A finished follow-up joins the queue without holding up the
+                # next core question; only at the end do we wait for it
+                follow_up = await self.take_follow_up(wait=i >= len(questions))
+                if follow_up:
+                    questions.append(follow_up)
+                if i >= len(questions):
+                    break
+                question = questions[i]
                 print(f"\n🎯 Question {i+1}/{len(questions)}")
                 
                 # Ask question using TTS
@@ -457,24 +963,24 @@ class InterviewController:
                 answer = await self.audio_handler.speech_to_text()
                 self.session.answers.append(answer)
                 
+                # Speculatively generate the follow-up while this answer is
+                # scored and the next question is spoken
+                if i < len(questions) - 1:
+                    self.prefetch_follow_up()
+                
                 # Score the answer
-                score_result = self.report_generator.scorer.score_answer(
+                score_result = await self.report_generator.scorer.ascore_answer(
                     question, answer, self.session.user_role
                 )
                 self.answer_scores.append(score_result)
                 
                 print(f"📝 Answer recorded: {answer[:100]}...")
                 print(f"📊 Score: {score_result['score']}/100")
-                
-                # Generate adaptive follow-up if needed
-                if i < len(questions) - 1:
-                    follow_up = await self.generate_adaptive_question()
-                    if follow_up:
-                        questions.append(follow_up)
+                i += 1
             
             # Generate final report
             emotion_summary = self.emotion_analyzer.get_emotion_summary()
-            final_report = self.report_generator.generate_comprehensive_report(
+            final_report = await self.report_generator.agenerate_comprehensive_report(
                 self.session, self.answer_scores, emotion_summary
             )
             
@@ -485,6 +991,58 @@ class InterviewController:
             print(f"❌ Interview error: {e}")
             return {'error': str(e)}
     
+    def prefetch_follow_up(self) -> asyncio.Task:
+        """Start generating (and synthesizing) the follow-up to the latest answer"""
+        self.discard_follow_up()
+        self.follow_up_for = len(self.session.answers)
+        self.follow_up_task = asyncio.create_task(self._speculate_follow_up())
+        follow_up_stats['started'] += 1
+        return self.follow_up_task
+    
+    async def _speculate_follow_up(self) -> Optional[str]:
+        follow_up = await self.generate_adaptive_question()
+        if follow_up:
+            await tts_cache.prefetch([follow_up])
+        return follow_up
+    
+    async def take_follow_up(self, wait: bool = True, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Claim the speculative follow-up question.
+        
+        Without `wait`, returns None (keeping the speculation running) unless
+        it has already finished. A speculation based on an older set of
+        answers, or one that does not finish within `timeout`, is discarded.
+        """
+        task = self.follow_up_task
+        if task is None or (not wait and not task.done()):
+            return None
+        if self.follow_up_for != len(self.session.answers):
+            self.discard_follow_up()
+            return None
+        
+        was_ready = task.done()
+        needed_at = time.monotonic()
+        try:
+            follow_up = await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            self.discard_follow_up()
+            return None
+        finally:
+            # How long the candidate waits past asking for the next question
+            question_gap.record(0.0 if was_ready else time.monotonic() - needed_at)
+        self.follow_up_task = None
+        if follow_up:
+            follow_up_stats['used'] += 1
+            follow_up_stats['ready_when_needed'] += was_ready
+        return follow_up
+    
+    def discard_follow_up(self):
+        """Cancel or drop a speculative follow-up the flow no longer needs"""
+        if self.follow_up_task is not None:
+            self.follow_up_task.cancel()
+            self.follow_up_task = None
+            follow_up_stats['discarded'] += 1
+    
     async def generate_adaptive_question(self) -> Optional[str]:
         """Generate adaptive follow-up question based on previous answers"""
         if len(self.session.answers) < 2:
@@ -505,12 +1063,24 @@ class InterviewController:
         """
         
         try:
-            response = llm.invoke(prompt)
-            return response.content.strip()
-        except:
+            content = await llm_client.ainvoke(
+                prompt, cache_key=("adaptive", "adaptive-v1", self.session.user_role, context)
+            )
+            return content.strip()
+        except Exception:
             return None
     
     def add_emotion_data(self, frame: np.ndarray):
         """Add emotion analysis for current frame"""
         result = self.emotion_analyzer.analyze_webcam_frame(frame)
-        return result
\ No newline at end of file
+        return result
+    
+    def add_encoded_frame(self, data: bytes):
+        """Add emotion analysis for an encoded (JPEG/PNG) frame"""
+        return self.emotion_analyzer.analyze_encoded_frame(data)
+    
+    async def aadd_emotion_data(self, frame: np.ndarray) -> Dict:
+        return await self.emotion_analyzer.aanalyze_webcam_frame(frame)
+    
+    async def aadd_encoded_frame(self, data: bytes) -> Dict:
+        return await self.emotion_analyzer.aanalyze_encoded_frame(data)
\ No newline at end of file
@@ -0,0 +1,110 @@
+import threading
+from typing import Dict
+
+import numpy as np
+
+from app.config import Config
+
+_totals_lock = threading.Lock()
+_totals = {'chunks': 0, 'speech_chunks': 0, 'silent_chunks': 0}
+
+
+class EnergyVAD:
+    """
+    Vectorised energy + zero-crossing voice activity detector for int16 PCM.
+
+    Each chunk is split into `frame_ms` frames and classified in one NumPy
+    pass. A frame is voiced when its RMS clears an adaptive noise floor by
+    `threshold_ratio` and its zero-crossing rate is speech-like (or its
+    energy is high enough to be voiced regardless). The noise floor starts
+    low (so an answer that opens with speech is still detected) and tracks
+    the quietest frame of each chunk: it drops to a quieter frame at once and
+    rises towards louder ones by `noise_rise` per frame. `hangover_ms`
+    keeps the detector "in speech" briefly after the last voiced frame so
+    word endings and short pauses are not cut. Samples that do not fill a
+    whole frame are carried over to the next call, so the result does not
+    depend on how the stream is chunked.
+    """
+
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 20,
+                 threshold_ratio: float = Config.VAD_THRESHOLD_RATIO,
+                 min_rms: float = Config.VAD_MIN_RMS,
+                 hangover_ms: int = Config.VAD_HANGOVER_MS,
+                 max_zcr: float = 0.35, noise_rise: float = 0.005):
+        self.sample_rate = sample_rate
+        self.frame_len = int(sample_rate * frame_ms / 1000)
+        self.threshold_ratio = threshold_ratio
+        self.min_rms = min_rms
+        self.hangover = hangover_ms / 1000
+        self.max_zcr = max_zcr
+        self.noise_rise = noise_rise
+        # Starts where the threshold equals min_rms, never at speech level
+        self.noise_floor = min_rms / threshold_ratio
+        self.in_speech = False
+        self.has_spoken = False
+        self.silence_seconds = 0.0
+        self.since_voiced = float('inf')
+        self.chunks = 0
+        self.speech_chunks = 0
+        self._remainder = np.zeros(0, dtype=np.int16)
+
+    def process(self, chunk: bytes) -> bool:
+        """Classify a PCM chunk; returns True while in speech (incl. hangover)"""
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        if self._remainder.size:
+            samples = np.concatenate([self._remainder, samples])
+        n_frames = len(samples) // self.frame_len
+        self._remainder = samples[n_frames * self.frame_len:].copy()
+        if n_frames == 0:
+            return self.in_speech
+        duration = n_frames * self.frame_len / self.sample_rate
+
+        frames = samples[:n_frames * self.frame_len].reshape(n_frames, self.frame_len).astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        signs = np.signbit(frames)
+        zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+        threshold = max(self.noise_floor * self.threshold_ratio, self.min_rms)
+        voiced = (rms > threshold) & ((zcr < self.max_zcr) | (rms > 2 * threshold))
+
+        # Minimum tracking: fall at once, rise slowly (pauses between words
+        # keep the chunk minimum near the room noise during speech)
+        quietest = float(rms.min())
+        if quietest < self.noise_floor:
+            self.noise_floor = quietest
+        else:
+            rise = 1 - (1 - self.noise_rise) ** n_frames
+            self.noise_floor += rise * (quietest - self.noise_floor)
+
+        if voiced.any():
+            # Time since the last voiced frame within this chunk
+            last_voiced = n_frames - 1 - int(np.flatnonzero(voiced)[-1])
+            self.since_voiced = last_voiced * self.frame_len / self.sample_rate
+            self.has_spoken = True
+        else:
+            self.since_voiced += duration
+
+        self.in_speech = self.since_voiced < self.hangover
+        self.silence_seconds = 0.0 if self.in_speech else self.since_voiced
+
+        self.chunks += 1
+        self.speech_chunks += self.in_speech
+        with _totals_lock:
+            _totals['chunks'] += 1
+            _totals['speech_chunks' if self.in_speech else 'silent_chunks'] += 1
+        return self.in_speech
+
+    def stats(self) -> Dict:
+        return {
+            'chunks': self.chunks,
+            'speech_chunks': self.speech_chunks,
+            'noise_floor': round(self.noise_floor, 1)
+        }
+
+
+def vad_totals() -> Dict:
+    """Process-wide chunk counts; silent chunks never reach the recognizer"""
+    with _totals_lock:
+        totals = dict(_totals)
+    totals['skip_rate'] = round(totals['silent_chunks'] / totals['chunks'], 3) if totals['chunks'] else 0
+    return totals
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from typing import Callable, Dict
+
+
+class ModelReadiness:
+    """
+    Tracks warm-up of the models a worker needs before it can take traffic.
+
+    Each registered model has a loader that loads it and runs one dummy
+    inference. `warm_up` runs all loaders concurrently in threads and records
+    per-model state (pending/loading/ready/failed) and load time; the worker
+    is ready once every required model is ready.
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], object]] = {}
+        self._required: Dict[str, bool] = {}
+        self._status: Dict[str, Dict] = {}
+
+    def register(self, name: str, loader: Callable[[], object], required: bool = True):
+        self._loaders[name] = loader
+        self._required[name] = required
+        self._status[name] = {'state': 'pending', 'required': required, 'load_seconds': None}
+
+    async def warm_up(self):
+        await asyncio.gather(*(self._warm_up_one(name) for name in self._loaders))
+
+    async def _warm_up_one(self, name: str):
+        status = self._status[name]
+        status['state'] = 'loading'
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(self._loaders[name])
+            status['state'] = 'ready'
+        except Exception as e:
+            status['state'] = 'failed'
+            status['error'] = str(e)
+            print(f"❌ Warm-up failed for {name}: {e}")
+        status['load_seconds'] = round(time.perf_counter() - start, 3)
+        if status['state'] == 'ready':
+            print(f"🔥 {name} ready in {status['load_seconds']:.2f}s")
+
+    def is_ready(self, name: str = None) -> bool:
+        if name is not None:
+            return self._status.get(name, {}).get('state') == 'ready'
+        return all(
+            status['state'] == 'ready'
+            for name, status in self._status.items() if self._required[name]
+        )
+
+    def report(self) -> Dict:
+        return {name: dict(status) for name, status in self._status.items()}
+
+
+# Global readiness tracker
+readiness = ModelReadiness()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Emotion inference throughput: per-frame calls vs cross-session micro-batching
+============================================================================
+
+Simulates N concurrent sessions on one event loop, each analyzing webcam
+frames back to back through the same path the API uses
+(DeepFaceAnalyzer.aanalyze_frame on the shared inference executor, with a
+per-session FaceTracker):
+
+  single   - the emotion model runs on each frame's crop inside the pool
+             thread (batch of 1)
+  batched  - the crop is handed to the shared EmotionBatcher and awaited on
+             the event loop, so the pool thread is free while the batch fills
+
+Throughput is reported as frames per wall-clock second and frames per CPU
+second (process CPU time across all cores), i.e. frames/sec per core.
+The pool size comes from INFERENCE_WORKERS / INFERENCE_QUEUE_SIZE.
+
+Usage:
+    INFERENCE_WORKERS=1 python benchmarks/emotion_batching.py --sessions 16 --frames 50 --window-ms 15
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import Config
+from app.src.deepface import DeepFaceAnalyzer
+from app.src.executors import PoolSaturatedError, inference_executor
+from app.src.tracking import FaceTracker
+
+
+async def run_sessions(analyzer: DeepFaceAnalyzer, sessions: int, frames: int) -> dict:
+    rng = np.random.default_rng(0)
+    session_frames = [rng.integers(0, 255, size=(240, 320, 3), dtype=np.uint8) for _ in range(sessions)]
+    rejected = 0
+
+    async def session_worker(frame):
+        nonlocal rejected
+        tracker = FaceTracker()
+        done = 0
+        while done < frames:
+            try:
+                await analyzer.aanalyze_frame(frame, ['emotion'], tracker=tracker)
+                done += 1
+            except PoolSaturatedError:
+                rejected += 1
+                await asyncio.sleep(0.005)
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(session_worker(frame) for frame in session_frames))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    total = sessions * frames
+    return {'frames': total, 'fps': total / wall, 'fps_per_core': total / cpu if cpu else 0, 'rejected': rejected}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=16)
+    parser.add_argument('--frames', type=int, default=50)
+    parser.add_argument('--window-ms', type=float, default=15)
+    parser.add_argument('--max-batch', type=int, default=32)
+    args = parser.parse_args()
+
+    single_analyzer = DeepFaceAnalyzer(batching=False)
+    batched_analyzer = DeepFaceAnalyzer(batching=True)
+    batched_analyzer.batcher.max_batch = args.max_batch
+    batched_analyzer.batcher.window = args.window_ms / 1000
+    print("⏳ Loading detector and emotion model...")
+    single_analyzer.detect_face(np.zeros((240, 320, 3), dtype=np.uint8))
+    single_analyzer.classify_emotions([np.zeros((48, 48, 3), dtype=np.uint8)])
+    batched_analyzer._emotion_model = single_analyzer.get_emotion_model()
+
+    single = await run_sessions(single_analyzer, args.sessions, args.frames)
+    batched = await run_sessions(batched_analyzer, args.sessions, args.frames)
+    batch_stats = batched_analyzer.batcher.stats()
+
+    print(f"\n👥 {args.sessions} sessions x {args.frames} frames, window {args.window_ms}ms, "
+          f"{Config.INFERENCE_WORKERS} inference worker(s)")
+    print(f"{'mode':<8} {'frames/s':>10} {'frames/s/core':>15} {'rejected':>9}")
+    print(f"{'single':<8} {single['fps']:>10.1f} {single['fps_per_core']:>15.1f} {single['rejected']:>9}")
+    print(f"{'batched':<8} {batched['fps']:>10.1f} {batched['fps_per_core']:>15.1f} {batched['rejected']:>9}")
+    print(f"\n📦 Avg batch size {batch_stats['avg_batch_size']}, "
+          f"largest {batch_stats['largest_batch']}, avg forward {batch_stats['avg_forward_ms']}ms")
+    print(f"⚡ Speed-up per core: x{batched['fps_per_core'] / single['fps_per_core']:.2f}")
+    inference_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Frame ingestion benchmark: base64-in-JSON vs raw binary upload
+===============================================================
+
+Compares the two ways a webcam frame reaches EmotionAnalyzer:
+
+  json    - POST /analyze_emotion: JSON body with a base64 data URL, parsed,
+            split, b64decoded, opened with PIL and converted with np.array
+  binary  - POST /analyze_emotion/frame: raw image/jpeg body decoded with
+            cv2.imdecode into a reused RGB buffer (FrameDecoder)
+
+Only the transport/decode work is measured (no DeepFace), so the numbers
+show the per-frame overhead that the binary path removes.
+
+Usage:
+    python benchmarks/frame_ingest.py --frames 500 --width 640 --height 480
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+from io import BytesIO
+
+import cv2
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.src.frames import FrameDecoder
+
+
+def make_jpeg(width: int, height: int, quality: int) -> bytes:
+    """Synthetic webcam-like frame: smooth gradients plus sensor noise"""
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.stack([
+        (x * 255 // max(width - 1, 1)),
+        (y * 255 // max(height - 1, 1)),
+        ((x + y) * 255 // max(width + height - 2, 1))
+    ], axis=-1).astype(np.int16)
+    frame += rng.integers(-12, 12, size=frame.shape, dtype=np.int16)
+    frame = np.clip(frame, 0, 255).astype(np.uint8)
+    ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    assert ok
+    return encoded.tobytes()
+
+
+def json_path(body: bytes) -> np.ndarray:
+    payload = json.loads(body)
+    image_data = payload['image']
+    if image_data.startswith('data:image'):
+        image_data = image_data.split(',')[1]
+    image = Image.open(BytesIO(base64.b64decode(image_data)))
+    return np.array(image)
+
+
+def time_per_frame(fn, body, frames: int) -> float:
+    fn(body)  # warm-up
+    start = time.process_time()
+    for _ in range(frames):
+        fn(body)
+    return (time.process_time() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--width', type=int, default=640)
+    parser.add_argument('--height', type=int, default=480)
+    parser.add_argument('--quality', type=int, default=80)
+    args = parser.parse_args()
+
+    jpeg = make_jpeg(args.width, args.height, args.quality)
+    data_url = 'data:image/jpeg;base64,' + base64.b64encode(jpeg).decode('ascii')
+    json_body = json.dumps({'image': data_url, 'session_id': 'bench'}).encode()
+
+    decoder = FrameDecoder()
+    json_cpu = time_per_frame(json_path, json_body, args.frames)
+    binary_cpu = time_per_frame(decoder.decode, jpeg, args.frames)
+
+    print(f"📐 Frame: {args.width}x{args.height} JPEG q={args.quality}, {args.frames} frames")
+    print(f"{'path':<8} {'bytes/frame':>12} {'cpu ms/frame':>14}")
+    print(f"{'json':<8} {len(json_body):>12} {json_cpu * 1000:>14.3f}")
+    print(f"{'binary':<8} {len(jpeg):>12} {binary_cpu * 1000:>14.3f}")
+    print(f"\n📉 Bytes on the wire: -{(1 - len(jpeg) / len(json_body)) * 100:.1f}%")
+    print(f"⚡ Decode CPU per frame: -{(1 - binary_cpu / json_cpu) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
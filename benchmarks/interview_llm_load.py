@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Interview LLM load test against the offline stub backend
+========================================================
+
+Runs N simulated interviews concurrently through the real question bank,
+scorer and report generator, with the LLM replaced by StubBackend (or a
+recorded run via --replay DIR), and compares the two scoring modes:
+
+  background  - one scoring call per answer (what /record_answer queues)
+  batch       - all answers scored in one call at /finish_interview
+
+Reported per mode: interviews per second, finish latency (mean / p95), and
+per interview the number of LLM calls, LLM seconds and estimated prompt
+tokens spent on scoring.
+
+Usage:
+    python benchmarks/interview_llm_load.py --interviews 50 --latency-ms 800 --jitter-ms 300
+    python benchmarks/interview_llm_load.py --interviews 20 --replay llm_recordings
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import Config
+from app.src.llm import llm_client, set_backend
+from app.src.llm_backends import RecordReplayBackend, StubBackend
+from app.src.utils import InterviewSession, ReportGenerator
+
+SAMPLE_ANSWERS = [
+    "I have worked on backend services in Python for three years, mostly APIs and data pipelines.",
+    "My main strength is debugging production issues calmly and writing clear postmortems.",
+    "We migrated a monolith to services and I owned the billing component end to end.",
+    "I read engineering blogs, follow release notes and build small side projects.",
+    ""
+]
+
+
+async def run_interview(role: str, answers: int) -> dict:
+    session = InterviewSession(role)
+    await session.ainitialize_questions()
+    session.answers = [SAMPLE_ANSWERS[i % len(SAMPLE_ANSWERS)] for i in range(min(answers, len(session.questions)))]
+
+    report_generator = ReportGenerator()
+    start = time.perf_counter()
+    await report_generator.agenerate_comprehensive_report(
+        session, [None] * len(session.answers), {'dominant_emotion': 'neutral', 'confidence': 80}
+    )
+    return {'finish_seconds': time.perf_counter() - start, **report_generator.scorer.usage()}
+
+
+async def run_mode(mode: str, interviews: int, concurrency: int, answers: int) -> dict:
+    Config.SCORING_MODE = mode
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(i):
+        async with semaphore:
+            return await run_interview("Software Engineer", answers)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(limited(i) for i in range(interviews)))
+    elapsed = time.perf_counter() - start
+
+    finish = [r['finish_seconds'] for r in results]
+    return {
+        'interviews_per_s': interviews / elapsed,
+        'finish_mean_s': float(np.mean(finish)),
+        'finish_p95_s': float(np.percentile(finish, 95)),
+        'llm_calls': float(np.mean([r['llm_calls'] for r in results])),
+        'llm_seconds': float(np.mean([r['llm_seconds'] for r in results])),
+        'prompt_tokens': float(np.mean([r['prompt_tokens'] for r in results])),
+        'fallbacks': sum(r['batch_fallbacks'] for r in results)
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--interviews', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--answers', type=int, default=5)
+    parser.add_argument('--latency-ms', type=float, default=Config.LLM_STUB_LATENCY_MS)
+    parser.add_argument('--jitter-ms', type=float, default=Config.LLM_STUB_JITTER_MS)
+    parser.add_argument('--dist', default=Config.LLM_STUB_LATENCY_DIST)
+    parser.add_argument('--error-rate', type=float, default=Config.LLM_STUB_ERROR_RATE)
+    parser.add_argument('--replay', default=None, help="replay recorded responses from this directory instead")
+    args = parser.parse_args()
+
+    # Simulated interviews repeat the same answers; cache hits would hide
+    # the calls and tokens each scoring mode really spends
+    llm_client.cache = None
+
+    if args.replay:
+        set_backend(RecordReplayBackend("replay", directory=args.replay))
+    else:
+        set_backend(StubBackend(args.latency_ms, args.jitter_ms, args.dist, args.error_rate))
+
+    print(f"{'mode':<12} {'int/s':>7} {'finish':>8} {'p95':>8} {'calls':>6} {'llm s':>7} {'tokens':>7} {'fallbk':>6}")
+    results = {}
+    for mode in ("background", "batch"):
+        results[mode] = r = await run_mode(mode, args.interviews, args.concurrency, args.answers)
+        print(f"{mode:<12} {r['interviews_per_s']:>7.2f} {r['finish_mean_s']:>7.2f}s {r['finish_p95_s']:>7.2f}s "
+              f"{r['llm_calls']:>6.1f} {r['llm_seconds']:>7.2f} {r['prompt_tokens']:>7.0f} {r['fallbacks']:>6}")
+
+    background, batch = results['background'], results['batch']
+    if background['llm_seconds'] and background['prompt_tokens']:
+        print(f"\n📉 Batch scoring per interview: {1 - batch['llm_calls'] / background['llm_calls']:.0%} fewer calls, "
+              f"{1 - batch['llm_seconds'] / background['llm_seconds']:.0%} less LLM time, "
+              f"{1 - batch['prompt_tokens'] / background['prompt_tokens']:.0%} fewer prompt tokens")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
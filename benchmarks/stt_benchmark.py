@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Offline STT pipeline benchmark (no microphone needed)
+=====================================================
+
+Replaces the `sounddevice` module seen by AudioHandler.speech_to_text with a
+fake whose InputStream replays WAV files through the same callback path a
+live microphone would use, at real-time or accelerated speed. After the file
+ends it keeps delivering silence, so the VAD end-of-answer logic runs exactly
+as in production.
+
+Answer archiving is switched off for the run, so nothing is written to
+ARCHIVE_DIR.
+
+Fixtures: a directory of 16 kHz mono int16 `*.wav` files, each with an
+optional `<name>.txt` reference transcript next to it.
+
+Reported per file and in total:
+  rtf              time spent in the transcriber's feed/finish calls / audio
+                   duration (decoder cost; replay pacing and the trailing
+                   end-of-answer silence wait are excluded)
+  cpu_per_audio_s  process CPU seconds spent per second of audio
+  eou_latency_ms   last voiced sample delivered -> transcript returned
+  wer              word error rate against the reference transcript
+
+Usage:
+    python benchmarks/stt_benchmark.py fixtures/stt --speed 1     # real time
+    python benchmarks/stt_benchmark.py fixtures/stt --speed 8     # 8x faster
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import sys
+import threading
+import time
+import types
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class WavReplayStream:
+    """Drop-in for sounddevice.InputStream that plays a WAV file into the callback"""
+
+    # Set by the benchmark before each run
+    source: np.ndarray = np.zeros(0, dtype=np.int16)
+    speed: float = 1.0
+    voiced_threshold: int = 500
+    last_voiced_at: float = None
+
+    def __init__(self, samplerate, channels, dtype, blocksize, callback, **kwargs):
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.callback = callback
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        WavReplayStream.last_voiced_at = None
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        source = WavReplayStream.source
+        block_seconds = self.blocksize / self.samplerate
+        silence = np.zeros((self.blocksize, 1), dtype=np.int16)
+        next_time = time.perf_counter()
+        position = 0
+
+        while not self._stop.is_set():
+            if position < len(source):
+                block = source[position:position + self.blocksize]
+                if len(block) < self.blocksize:
+                    block = np.concatenate([block, np.zeros(self.blocksize - len(block), dtype=np.int16)])
+                block = block.reshape(-1, 1)
+                position += self.blocksize
+            else:
+                block = silence
+
+            self.callback(block, self.blocksize, None, None)
+            if np.abs(block).max() >= WavReplayStream.voiced_threshold:
+                WavReplayStream.last_voiced_at = time.perf_counter()
+
+            if WavReplayStream.speed > 0:
+                next_time += block_seconds / WavReplayStream.speed
+                time.sleep(max(next_time - time.perf_counter(), 0))
+
+
+class DecoderTimer:
+    """Accumulates the time spent inside StreamingTranscriber.feed/finish"""
+    seconds = 0.0
+
+    @classmethod
+    def install(cls):
+        from app.src.stt import StreamingTranscriber
+
+        for name in ('feed', 'finish'):
+            original = getattr(StreamingTranscriber, name)
+
+            def timed(self, *args, _original=original):
+                start = time.perf_counter()
+                try:
+                    return _original(self, *args)
+                finally:
+                    cls.seconds += time.perf_counter() - start
+
+            setattr(StreamingTranscriber, name, timed)
+
+
+def install_fake_sounddevice():
+    fake = types.ModuleType("sounddevice")
+    fake.InputStream = WavReplayStream
+    fake.query_devices = lambda: [{'name': 'wav-replay', 'max_input_channels': 1}]
+    sys.modules["sounddevice"] = fake
+
+
+def read_wav(path: str) -> np.ndarray:
+    with wave.open(path, 'rb') as wav_file:
+        if wav_file.getframerate() != 16000 or wav_file.getnchannels() != 1 or wav_file.getsampwidth() != 2:
+            raise ValueError(f"{path}: expected 16 kHz mono int16 WAV")
+        return np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+
+
+def word_errors(reference: str, hypothesis: str) -> tuple:
+    """(edit distance in words, reference word count)"""
+    ref, hyp = reference.lower().split(), hypothesis.lower().split()
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                             previous[j - 1] + (ref_word != hyp_word))
+        previous = current
+    return previous[-1], len(ref)
+
+
+async def transcribe(handler, audio: np.ndarray, speed: float) -> dict:
+    WavReplayStream.source = audio
+    WavReplayStream.speed = speed
+    DecoderTimer.seconds = 0.0
+
+    cpu_start = time.process_time()
+    text = await handler.speech_to_text(max_duration=len(audio) / 16000 / max(speed, 1) + 30)
+    done = time.perf_counter()
+
+    audio_seconds = len(audio) / 16000
+    last_voiced = WavReplayStream.last_voiced_at
+    return {
+        'text': text,
+        'audio_seconds': audio_seconds,
+        'rtf': DecoderTimer.seconds / audio_seconds,
+        'cpu_per_audio_s': (time.process_time() - cpu_start) / audio_seconds,
+        'eou_latency_ms': (done - last_voiced) * 1000 if last_voiced else None
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixtures', help="directory with *.wav files and optional *.txt references")
+    parser.add_argument('--speed', type=float, default=1.0, help="replay speed (1 = real time, 0 = unthrottled)")
+    args = parser.parse_args()
+
+    install_fake_sounddevice()
+    from app.src.utils import InterviewSession, AudioHandler
+    from app.src.stt import recognizer_pool
+    from app.src.archive import answer_archiver
+
+    # Benchmark answers are not interviews; keep them out of ARCHIVE_DIR
+    answer_archiver.enabled = False
+    DecoderTimer.install()
+    recognizer_pool.warm_up()
+    handler = AudioHandler(InterviewSession("Benchmark"))
+
+    wav_paths = sorted(glob.glob(os.path.join(args.fixtures, '*.wav')))
+    if not wav_paths:
+        sys.exit(f"No .wav fixtures in {args.fixtures}")
+
+    totals = {'audio': 0.0, 'decode': 0.0, 'cpu': 0.0, 'errors': 0, 'words': 0}
+    latencies = []
+    print(f"{'file':<28} {'audio s':>8} {'rtf':>6} {'cpu/s':>7} {'eou ms':>8} {'wer':>6}")
+
+    for path in wav_paths:
+        result = await transcribe(handler, read_wav(path), args.speed)
+        reference_path = os.path.splitext(path)[0] + '.txt'
+        wer_text = '-'
+        if os.path.exists(reference_path):
+            with open(reference_path) as reference_file:
+                errors, words = word_errors(reference_file.read(), result['text'])
+            totals['errors'] += errors
+            totals['words'] += words
+            wer_text = f"{errors / words:.3f}" if words else '-'
+
+        totals['audio'] += result['audio_seconds']
+        totals['decode'] += result['rtf'] * result['audio_seconds']
+        totals['cpu'] += result['cpu_per_audio_s'] * result['audio_seconds']
+        if result['eou_latency_ms'] is not None:
+            latencies.append(result['eou_latency_ms'])
+
+        eou = f"{result['eou_latency_ms']:.0f}" if result['eou_latency_ms'] is not None else '-'
+        print(f"{os.path.basename(path):<28} {result['audio_seconds']:>8.2f} {result['rtf']:>6.2f} "
+              f"{result['cpu_per_audio_s']:>7.3f} {eou:>8} {wer_text:>6}")
+
+    print(f"\n📊 {len(wav_paths)} files, {totals['audio']:.1f}s audio at speed x{args.speed:g}")
+    print(f"   RTF {totals['decode'] / totals['audio']:.3f}, CPU per audio second {totals['cpu'] / totals['audio']:.3f}s")
+    if latencies:
+        print(f"   End-of-utterance latency: mean {np.mean(latencies):.0f}ms, p95 {np.percentile(latencies, 95):.0f}ms")
+    if totals['words']:
+        print(f"   WER {totals['errors'] / totals['words']:.3f} over {totals['words']} reference words")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,6 +2,7 @@
 class InterviewSession {
     constructor() {
         this.userRole = new URLSearchParams(window.location.search).get('domain') || 'Software Engineer';
+        this.sessionId = null;
         this.currentQuestionIndex = 0;
         this.totalQuestions = 5;
         this.isRecording = false;
@@ -62,6 +63,7 @@ class InterviewSession {
             });
             const data = await response.json();
             if (data.success) {
+                this.sessionId = data.session_id;
                 this.totalQuestions = data.questions.length;
                 this.totalQ.textContent = this.totalQuestions;
                 this.isInterviewActive = true;
@@ -78,10 +80,11 @@ class InterviewSession {
     async askCurrentQuestion() {
         try {
             this.addStatus('Loading question...', 'info');
-            const response = await fetch(`/ask_question/${this.currentQuestionIndex}`);
+            const response = await fetch(`/ask_question/${this.currentQuestionIndex}?session_id=${this.sessionId}&play=false`);
             const data = await response.json();
             if (data.success) {
                 this.currentQuestion.textContent = data.question;
+                new Audio(data.audio_url).play().catch(() => {});
                 this.updateProgress();
                 this.addStatus('Question ready. Click record to answer.', 'primary');
             }
@@ -106,7 +109,7 @@ class InterviewSession {
             const response = await fetch('/record_answer', {
                 method: 'POST',
                 headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({session_id: 'default'})
+                body: JSON.stringify({session_id: this.sessionId})
             });
             const data = await response.json();
             if (data.success) {
@@ -127,18 +130,38 @@ class InterviewSession {
         this.recordBtn.disabled = true;
         this.nextBtn.disabled = false;
     }
-    handleAnswerRecorded(data) {
-        this.addStatus(`Answer recorded! Score: ${data.score}/100`, 'success');
+    async handleAnswerRecorded(data) {
+        if (data.score_status === 'deferred' || !data.score_url) {
+            this.addStatus('Answer recorded! It will be scored with the final report.', 'success');
+            return;
+        }
+        this.addStatus('Answer recorded! Scoring in the background...', 'success');
         this.liveFeedback.innerHTML = `
-            <div class="alert alert-info">
-                <strong>Answer Score:</strong> ${data.score}/100<br>
-                <strong>Feedback:</strong> ${data.feedback}
-            </div>
+            <div class="alert alert-secondary">Scoring your answer...</div>
         `;
+        try {
+            // Long-poll until the background score is ready
+            let score = {status: 'pending'};
+            while (score.status === 'pending') {
+                const response = await fetch(`${data.score_url}?wait=20`);
+                score = await response.json();
+                if (!response.ok) return;
+            }
+            if (score.status !== 'done') return;
+            this.addStatus(`Answer ${data.question_index + 1} scored: ${score.score}/100`, 'info');
+            this.liveFeedback.innerHTML = `
+                <div class="alert alert-info">
+                    <strong>Answer Score:</strong> ${score.score}/100<br>
+                    <strong>Feedback:</strong> ${score.feedback}
+                </div>
+            `;
+        } catch (error) {
+            this.addStatus('Could not fetch answer score', 'warning');
+        }
     }
     async nextQuestion() {
         this.currentQuestionIndex++;
-        if (this.currentQuestionIndex >= this.totalQuestions) {
+        if (this.currentQuestionIndex >= this.totalQuestions && !(await this.loadFollowUp())) {
             this.finishInterview();
         } else {
             this.recordBtn.disabled = false;
@@ -146,6 +169,20 @@ class InterviewSession {
             this.askCurrentQuestion();
         }
     }
+    async loadFollowUp() {
+        // Adaptive follow-up, usually generated while the last answer was scored
+        try {
+            const response = await fetch(`/follow_up_question?session_id=${this.sessionId}`);
+            const data = await response.json();
+            if (!data.success || !data.question) return false;
+            this.totalQuestions = data.total_questions;
+            this.totalQ.textContent = this.totalQuestions;
+            this.addStatus('Follow-up question based on your answers', 'info');
+            return true;
+        } catch (error) {
+            return false;
+        }
+    }
     async finishInterview() {
         this.isInterviewActive = false;
         this.stopEmotionAnalysis();
@@ -154,7 +191,7 @@ class InterviewSession {
             const response = await fetch('/finish_interview', {
                 method: 'POST',
                 headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({session_id: 'default'})
+                body: JSON.stringify({session_id: this.sessionId})
             });
             const data = await response.json();
             if (data.success) {
@@ -182,11 +219,11 @@ class InterviewSession {
             canvas.width = this.videoFeed.videoWidth;
             canvas.height = this.videoFeed.videoHeight;
             ctx.drawImage(this.videoFeed, 0, 0);
-            const imageData = canvas.toDataURL('image/jpeg', 0.8);
-            const response = await fetch('/analyze_emotion', {
+            const frame = await new Promise(resolve => canvas.toBlob(resolve, 'image/jpeg', 0.8));
+            const response = await fetch(`/analyze_emotion/frame?session_id=${this.sessionId}`, {
                 method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({image: imageData})
+                headers: {'Content-Type': 'image/jpeg'},
+                body: frame
             });
             const data = await response.json();
             if (data.success) {
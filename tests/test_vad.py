@@ -0,0 +1,43 @@
+import numpy as np
+
+from app.src.vad import EnergyVAD
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds: float, amplitude: float, freq: float = 200, seed: int = 0) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    noise = np.random.default_rng(seed).normal(0, 30, len(t))
+    return (amplitude * np.sin(2 * np.pi * freq * t) + noise).astype(np.int16)
+
+
+def feed(vad: EnergyVAD, signal: np.ndarray, chunk: int = 1600):
+    return [vad.process(signal[i:i + chunk].tobytes()) for i in range(0, len(signal), chunk)]
+
+
+def test_detects_speech_at_the_very_start():
+    vad = EnergyVAD(sample_rate=SAMPLE_RATE)
+    states = feed(vad, np.concatenate([tone(1.0, 3000), tone(1.0, 0, seed=1)]))
+
+    assert vad.has_spoken
+    assert all(states[:10])
+    assert not states[-1]
+    assert vad.noise_floor < vad.min_rms
+
+
+def test_room_noise_alone_is_not_speech():
+    vad = EnergyVAD(sample_rate=SAMPLE_RATE)
+    feed(vad, tone(2.0, 0))
+
+    assert not vad.has_spoken
+    assert vad.speech_chunks == 0
+
+
+def test_result_does_not_depend_on_chunking():
+    signal = np.concatenate([tone(0.5, 0), tone(0.5, 3000), tone(0.5, 0, seed=1)])
+    whole, split = EnergyVAD(sample_rate=SAMPLE_RATE), EnergyVAD(sample_rate=SAMPLE_RATE)
+    feed(whole, signal, chunk=len(signal))
+    feed(split, signal, chunk=100)
+
+    assert whole.has_spoken and split.has_spoken
+    assert abs(whole.since_voiced - split.since_voiced) < 0.02